@@ -14,7 +14,7 @@ import shutil
 from collections import defaultdict
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import BinaryIO, cast, Generator
+from typing import BinaryIO, cast, Generator, Literal, overload
 
 import scancode_config  # type: ignore[import-untyped]
 from joblib import Parallel, delayed  # type: ignore[import-untyped]
@@ -81,6 +81,16 @@ class RetrievalFlags:
             + cls.IMAGE_METADATA * retrieve_image_metadata
         )
 
+    @overload
+    @classmethod
+    def all(cls, as_kwargs: Literal[False] = False) -> int:
+        ...
+
+    @overload
+    @classmethod
+    def all(cls, as_kwargs: Literal[True]) -> dict[str, bool]:
+        ...
+
     @classmethod
     def all(cls, as_kwargs: bool = False) -> int | dict[str, bool]:
         """
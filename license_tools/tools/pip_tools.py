@@ -94,12 +94,11 @@ def download_package(
     if prefer_sdist:
         command += ["--no-binary", ":all:"]
     try:
+        # The progress output is not required, while errors are written to stderr.
         subprocess.run(
-            command, capture_output=True, text=True, check=True
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
         )
     except subprocess.CalledProcessError as exception:
-        if exception.stdout:
-            sys.stdout.write(exception.stdout)
         if exception.stderr:
             sys.stderr.write(exception.stderr)
         raise
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import datetime
 import logging
+import shutil
 import stat
 from enum import IntEnum, IntFlag
 from pathlib import Path
@@ -357,6 +358,12 @@ _HEADERS_TO_OMIT = {
 }
 
 
+_BUFFER_SIZE = 1024 * 1024
+"""
+The buffer size to use when copying archive members.
+"""
+
+
 def extract(archive_path: Path, target_path: Path) -> None:
     """
     Extract the given RPM file.
@@ -364,7 +371,8 @@ def extract(archive_path: Path, target_path: Path) -> None:
     :param archive_path: The RPM file to unpack.
     :param target_path: The directory to unpack to.
     """
-    target_path_str = str(target_path)
+    target_root = target_path.resolve()
+    created_directories: set[Path] = set()
 
     # See `rpmfile.cli` for the `extract` option.
     # This is a pathlib-based approach of the original implementation.
@@ -407,18 +415,19 @@ def extract(archive_path: Path, target_path: Path) -> None:
             with rpm_file.extractfile(rpm_info.name) as file_object:
                 directories = rpm_info.name.split("/")
                 filename = directories.pop()
-                if directories:
-                    directories_path = target_path.joinpath(*directories).resolve()
-                    if not str(directories_path).startswith(target_path_str):
-                        raise ValueError(f"Attempted path traversal: {directories_path}")
-                    if not directories_path.is_dir():
-                        directories_path.mkdir(parents=True)
-                else:
-                    directories_path = target_path.resolve()
+                directories_path = target_root.joinpath(*directories).resolve()
+                if not directories_path.is_relative_to(target_root):
+                    raise ValueError(f"Attempted path traversal: {directories_path}")
+                # The filename does not contain any separators, thus only these
+                # special names could leave the already validated directory.
+                if filename in {".", ".."}:
+                    raise ValueError(f"Attempted path traversal: {directories_path / filename}")
+                if directories_path not in created_directories:
+                    directories_path.mkdir(parents=True, exist_ok=True)
+                    created_directories.add(directories_path)
                 target_file = directories_path / filename
-                if not str(target_file).startswith(target_path_str):
-                    raise ValueError(f"Attempted path traversal: {target_file}")
-                target_file.write_bytes(file_object.read())
+                with open(target_file, mode="wb") as target:
+                    shutil.copyfileobj(file_object, target, _BUFFER_SIZE)
 
 
 def get_headers(rpm_path: Path) -> dict[str, Any]:
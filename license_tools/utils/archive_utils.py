@@ -8,16 +8,28 @@ Archive handling.
 
 from __future__ import annotations
 
+import logging
+import lzma
 import os
 import shutil
+import stat
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import cast
+from tempfile import mkdtemp
+from typing import Callable
 
 import extractcode  # type: ignore[import-untyped]
 from extractcode import all_kinds
 from extractcode.api import extract_archive as _extract_archive, extract_archives as _extract_archives  # type: ignore[import-untyped]
 from extractcode.archive import should_extract as _should_extract  # type: ignore[import-untyped]
 
+
+logger = logging.getLogger(__name__)
+del logging
+
 # Mitigate https://github.com/aboutcode-org/extractcode/issues/65
 # This is a particularly ugly workaround and I would indeed prefer an upstream
 # solution, but this would most likely be more complex and require more
@@ -30,6 +42,212 @@ if os.getenv("LICENSE_TOOLS_DISABLE_TZ_WORKAROUND", "").lower() != "true":  # pr
     extractcode.libarchive2.set_env_with_tz = lambda: None
 
 
+ArchiveHandler = Callable[[Path, Path], None]
+"""
+Function extracting the given archive (first parameter) to the given target directory (second parameter).
+"""
+
+_ZIP_SUFFIXES = frozenset({".jar", ".whl", ".zip"})
+"""
+Suffixes of archives which are ZIP files and are extracted using :mod:`zipfile` directly.
+"""
+
+_MAGIC_NUMBERS_BY_SUFFIX = {
+    ".bz2": b"BZh",
+    ".crate": b"\x1f\x8b",
+    ".gz": b"\x1f\x8b",
+    ".jar": b"PK\x03\x04",
+    ".rpm": b"\xed\xab\xee\xdb",
+    ".tgz": b"\x1f\x8b",
+    ".whl": b"PK\x03\x04",
+    ".xz": b"\xfd7zXZ\x00",
+    ".zip": b"PK\x03\x04",
+}
+"""
+Magic numbers of common archive types, which can be detected without the file type detection.
+"""
+
+_BUFFER_SIZE = 1024 * 1024
+"""
+The buffer size to use when copying archive members.
+"""
+
+_ZIP_MEMBER_ERRORS = (EOFError, NotImplementedError, lzma.LZMAError, zipfile.BadZipFile, zlib.error)
+"""
+Errors indicating a broken or unsupported ZIP member, which is skipped.
+"""
+
+
+def _get_member_path(name: str, target_directory: Path) -> Path | None:
+    """
+    Get the target path for the given archive member.
+
+    Like :meth:`zipfile.ZipFile.extract`, drive letters, leading slashes and
+    relative path components are removed to keep the member inside the target directory.
+
+    :param name: The name of the archive member.
+    :param target_directory: The target directory.
+    :return: The target path for the member. `None` if nothing remains of the name.
+    """
+    name = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    name = os.path.splitdrive(name)[1]
+    parts = [part for part in name.split(os.path.sep) if part not in {"", os.path.curdir, os.path.pardir}]
+    if not parts:
+        return None
+    return target_directory.joinpath(*parts)
+
+
+def _get_unique_path(path: Path, used_paths: set[Path]) -> Path:
+    """
+    Get a path which has not been used yet.
+
+    Like `extractcode`, duplicates are renamed by appending a counter to the
+    part of the name before the first dot, for example `file_1.tar.gz`.
+
+    :param path: The preferred path.
+    :param used_paths: The paths which have already been used.
+    :return: The given path if it is unused, otherwise a renamed variant.
+    """
+    if path not in used_paths:
+        return path
+    name = path.name
+    index = name.find(".", 1)
+    stem, suffix = (name, "") if index == -1 else (name[:index], name[index:])
+    counter = 1
+    while (candidate := path.with_name(f"{stem}_{counter}{suffix}")) in used_paths:
+        counter += 1
+    return candidate
+
+
+def _extract_zip_file(archive_path: Path, target_directory: Path) -> None:
+    """
+    Extract the given ZIP file.
+
+    In comparison to :meth:`zipfile.ZipFile.extractall`, this uses larger buffers,
+    reads small members at once and extracts the members in parallel.
+
+    :param archive_path: The ZIP file to unpack.
+    :param target_directory: The target directory to use.
+    """
+    if not zipfile.is_zipfile(archive_path):
+        # Misleading suffix, thus let `extractcode` handle the actual format.
+        _extract_with_extractcode(archive_path, target_directory)
+        return
+
+    members: list[tuple[zipfile.ZipInfo, Path]] = []
+    used_paths: set[Path] = set()
+    with zipfile.ZipFile(archive_path) as zip_file:
+        # Create the directories beforehand to avoid races between the workers.
+        for info in zip_file.infolist():
+            path = _get_member_path(name=info.filename, target_directory=target_directory)
+            if path is None:
+                continue
+            if info.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+                continue
+            if stat.S_ISLNK(info.external_attr >> 16):
+                # Like `extractcode`, do not create symlinks, which might point anywhere.
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Keep duplicate members instead of letting multiple workers write to the same file.
+            path = _get_unique_path(path=path, used_paths=used_paths)
+            used_paths.add(path)
+            members.append((info, path))
+    # Start with the largest members to not wait for them at the end.
+    members.sort(key=lambda member: member[0].compress_size, reverse=True)
+
+    # Each worker requires its own file handle, as `zipfile.ZipFile` is not thread-safe.
+    thread_data = threading.local()
+    zip_files: list[zipfile.ZipFile] = []
+
+    def extract_member(member: tuple[zipfile.ZipInfo, Path]) -> None:
+        info, path = member
+        if not hasattr(thread_data, "zip_file"):
+            thread_data.zip_file = zipfile.ZipFile(archive_path)
+            zip_files.append(thread_data.zip_file)
+        try:
+            with thread_data.zip_file.open(info) as source, open(path, mode="wb") as target:
+                if info.file_size < _BUFFER_SIZE:
+                    target.write(source.read())
+                else:
+                    shutil.copyfileobj(source, target, _BUFFER_SIZE)
+        except _ZIP_MEMBER_ERRORS as exception:
+            # Do not let one broken member prevent the analysis of the other ones.
+            logger.warning("Skipping broken member %s of %s: %s", info.filename, archive_path, exception)
+            path.unlink(missing_ok=True)
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for _ in executor.map(extract_member, members):
+                pass
+    finally:
+        for zip_file in zip_files:
+            zip_file.close()
+
+
+def _extract_with_extractcode(archive_path: Path, target_directory: Path) -> None:
+    """
+    Extract the given archive using `extractcode`.
+
+    :param archive_path: The archive to unpack.
+    :param target_directory: The target directory to use.
+    """
+    for _event in _extract_archive(location=archive_path, target=target_directory):
+        pass
+
+
+_HANDLERS_BY_SUFFIX: dict[str, ArchiveHandler] = dict.fromkeys(_ZIP_SUFFIXES, _extract_zip_file)
+"""
+Mapping of lowercase suffixes to dedicated extraction handlers. Archives with other suffixes are extracted using `extractcode`.
+"""
+
+
+def _remove_path(path: Path) -> None:
+    """
+    Remove the given path if it exists.
+
+    :param path: The file, directory or symlink to remove.
+    """
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        path.unlink()
+
+
+def _move_directory_contents(source: Path, target: Path, excluded: set[Path]) -> None:
+    """
+    Move the contents of the given source directory to the given target directory.
+
+    Directories existing in both locations are merged, while other entries
+    already existing inside the target directory are replaced.
+
+    :param source: The directory to move the contents from.
+    :param target: The directory to move the contents to.
+    :param excluded: Source paths to skip. Directories containing them are merged
+                     instead of being moved as a whole.
+    """
+    with os.scandir(source) as iterator:
+        entries = list(iterator)
+    for entry in entries:
+        path = Path(entry.path)
+        if path in excluded:
+            continue
+        destination = target / entry.name
+        is_target_directory = destination.is_dir() and not destination.is_symlink()
+        if entry.is_dir(follow_symlinks=False) and (
+            is_target_directory or any(path in excluded_path.parents for excluded_path in excluded)
+        ):
+            if not is_target_directory:
+                _remove_path(destination)
+                destination.mkdir()
+            _move_directory_contents(source=path, target=destination, excluded=excluded)
+            continue
+        _remove_path(destination)
+        os.replace(path, destination)
+
+
 def extract(archive_path: Path, target_directory: Path, recurse: bool = False) -> None:
     """
     Extract the given archive recursively.
@@ -39,17 +257,35 @@ def extract(archive_path: Path, target_directory: Path, recurse: bool = False) -
     :param recurse: Whether to use a recursive approach.
     """
     if recurse:
-        targets = set()
-        for event in _extract_archives(location=archive_path, all_formats=True, recurse=True):
-            if event.done:
-                shutil.copytree(src=Path(event.target), dst=target_directory, dirs_exist_ok=True)
-                targets.add(Path(event.target))
-        for target in targets:
-            if target.exists():
-                shutil.rmtree(target)
+        # `extractcode` always extracts next to the archive. Use a copy inside the target
+        # directory to not write to the source location and to ensure that the files
+        # are moved within the same file system afterwards.
+        target_directory.mkdir(parents=True, exist_ok=True)
+        working_directory = Path(mkdtemp(dir=target_directory))
+        try:
+            location = working_directory / archive_path.name
+            try:
+                os.link(archive_path, location)
+            except OSError:
+                shutil.copyfile(archive_path, location)
+            targets = [
+                Path(event.target)
+                for event in _extract_archives(location=location, all_formats=True, recurse=True)
+                if event.done
+            ]
+            # Nested archives are extracted inside the directories of their parent archives,
+            # thus skip them when handling their parents. Handling the archives in extraction
+            # order ensures that the contents of archives extracted later take precedence.
+            # All remains are deleted together with the working directory.
+            excluded = set(targets)
+            for target in targets:
+                if target.exists():
+                    _move_directory_contents(source=target, target=target_directory, excluded=excluded)
+        finally:
+            shutil.rmtree(working_directory)
     else:
-        for _event in _extract_archive(location=archive_path, target=target_directory):
-            pass
+        handler = _HANDLERS_BY_SUFFIX.get(archive_path.suffix.lower(), _extract_with_extractcode)
+        handler(archive_path, target_directory)
 
 
 def can_extract(archive_path: Path) -> bool:
@@ -59,8 +295,16 @@ def can_extract(archive_path: Path) -> bool:
     :param archive_path: The path to check for.
     :return: The check result.
     """
-    return cast(
-        bool,
+    magic_number = _MAGIC_NUMBERS_BY_SUFFIX.get(archive_path.suffix.lower())
+    if magic_number is not None:
+        # Avoid the comparably expensive file type detection for the common cases.
+        try:
+            with open(archive_path, mode="rb") as file_object:
+                if file_object.read(len(magic_number)) == magic_number:
+                    return True
+        except OSError:
+            pass
+    return bool(
         _should_extract(
             location=archive_path,
             kinds=all_kinds,
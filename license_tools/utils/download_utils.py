@@ -10,10 +10,14 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import BinaryIO
+from urllib.parse import urlsplit
 
 import requests
 
@@ -26,6 +30,11 @@ del logging
 
 USER_AGENT = f"https://github.com/stefan6419846/license_tools version {VERSION}"
 
+CHUNK_SIZE = 1024 * 1024
+"""
+The chunk size to use for streaming data.
+"""
+
 
 class ChecksumError(ValueError):
     """
@@ -65,11 +74,18 @@ class Download:
         :param data: The data to check.
         """
         if self.sha256 is not None:
-            digest = hashlib.sha256(data).hexdigest()
-            expected = self.sha256
-        else:
-            return
-        if digest != expected:
+            self.verify_digest(hashlib.sha256(data).hexdigest())
+
+    def verify_digest(self, digest: str) -> None:
+        """
+        Check if the given SHA256 digest matches the expected one.
+
+        Raises :class:`~ChecksumError` if something is wrong.
+
+        :param digest: The hexadecimal digest to check.
+        """
+        expected = self.sha256
+        if expected is not None and digest != expected:
             raise ChecksumError(f'Checksum mismatch: Got {digest}, expected {expected}!')
 
 
@@ -92,18 +108,21 @@ def get_session() -> requests.Session:
     return session
 
 
-def download_file(url: str, file_object: BinaryIO) -> None:
+def download_file(url: str, file_object: BinaryIO, session: requests.Session | None = None) -> None:
     """
     Download the given file to the given file object.
 
     :param url: The download URL to use.
     :param file_object: The binary file to download to. Reset after writing.
+    :param session: Session to use.
     """
-    session = get_session()
-    response = session.get(url)
-    if not response.ok:
-        raise DownloadError(f"Download not okay? {url} {response}")
-    file_object.write(response.content)
+    if session is None:
+        session = get_session()
+    with session.get(url, stream=True) as response:
+        if not response.ok:
+            raise DownloadError(f"Download not okay? {url} {response}")
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            file_object.write(chunk)
     file_object.seek(0)
 
 
@@ -119,22 +138,63 @@ def download_file_to_directory(download: Download, directory: Path, session: req
         session = get_session()
     target_path = directory / download.filename
     logger.info("Downloading %s to %s ...", download.url, target_path)
-    response = session.get(download.url)
-    if not response.ok:
-        raise DownloadError(f"Download not okay? {download.url} {response}")
-    download.verify_checksum(response.content)
-    target_path.write_bytes(response.content)
-
-
-def download_one_file_per_second(downloads: list[Download], directory: Path) -> None:
-    """
-    Download the given files with not more than one request per second. This conforms to
+    # Calculate the checksum while writing to avoid reading the file again.
+    digest = hashlib.sha256() if download.sha256 is not None else None
+    with session.get(download.url, stream=True) as response:
+        if not response.ok:
+            raise DownloadError(f"Download not okay? {download.url} {response}")
+        try:
+            with open(target_path, mode="wb") as file_object:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if digest is not None:
+                        digest.update(chunk)
+                    file_object.write(chunk)
+            if digest is not None:
+                download.verify_digest(digest.hexdigest())
+        except BaseException:
+            # Do not keep incomplete or invalid files.
+            target_path.unlink(missing_ok=True)
+            raise
+
+
+def download_one_file_per_second(downloads: list[Download], directory: Path, max_workers: int = 8) -> None:
+    """
+    Download the given files with not more than one request per second and host. This conforms to
     https://crates.io/data-access#api accordingly.
 
+    Downloads from different hosts are performed in parallel, using one session per host. If one
+    download fails, no further downloads are started and the first error which occurred is raised.
+
     :param downloads: List of downloads to perform.
     :param directory: Directory to download to.
+    :param max_workers: The maximum number of hosts to download from in parallel.
     """
-    session = get_session()
+    downloads_per_host: dict[str, list[Download]] = defaultdict(list)
     for download in downloads:
-        download_file_to_directory(download=download, directory=directory, session=session)
-        time.sleep(1)
+        downloads_per_host[urlsplit(download.url).netloc].append(download)
+    if not downloads_per_host:
+        return
+
+    failed = threading.Event()
+
+    def download_from_host(host_downloads: list[Download]) -> None:
+        # Sessions are not guaranteed to be thread-safe, thus do not share them between the workers.
+        session = get_session()
+        for index, download in enumerate(host_downloads):
+            if index:
+                time.sleep(1)
+            if failed.is_set():
+                return
+            try:
+                download_file_to_directory(download=download, directory=directory, session=session)
+            except Exception:
+                failed.set()
+                raise
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(downloads_per_host))) as executor:
+        futures = [
+            executor.submit(download_from_host, host_downloads) for host_downloads in downloads_per_host.values()
+        ]
+        # Raise the first error which occurred. Leaving the context waits for the other workers, which stop early.
+        for future in as_completed(futures):
+            future.result()
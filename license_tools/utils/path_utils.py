@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 from tempfile import mkdtemp
@@ -12,6 +13,25 @@ from typing import Any, cast, Generator, Type
 from typecode import magic2  # type: ignore[import-untyped]
 
 
+def _walk_files(directory: str) -> Generator[str, None, None]:
+    """
+    Get the paths of all files inside the given directory, recursively.
+
+    Symbolic links to directories are neither followed nor reported.
+
+    :param directory: The directory to walk through.
+    :return: The path strings of the files.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Regular entries are checked without an additional `stat` call.
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    yield from _walk_files(entry.path)
+                continue
+            yield entry.path
+
+
 def get_files_from_directory(
     directory: str | Path,
     prefix: str | None = None,
@@ -29,11 +49,10 @@ def get_files_from_directory(
         not directory_string.endswith("/")
     )
 
-    for path in sorted(Path(directory).rglob("*"), key=str):
-        if path.is_dir():
-            continue
-        short_path = str(path)[common_prefix_length:]
-        yield path, short_path
+    paths = list(_walk_files(str(Path(directory))))
+    paths.sort()
+    for path in paths:
+        yield Path(path), path[common_prefix_length:]
 
 
 class DirectoryWithFixedNameContext:
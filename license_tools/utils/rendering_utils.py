@@ -21,22 +21,21 @@ def render_dictionary(dictionary: dict[str, Any], verbose_names_mapping: dict[st
     :param multi_value_keys: Dictionary keys which could have multiple values.
     """
     maximum_length = max(map(len, verbose_names_mapping.values()))
+    indentation = " " * maximum_length + "   * "
     rendered = []
     for key, verbose_name in verbose_names_mapping.items():
         if key not in dictionary:
             continue
         value = dictionary[key]
+        name = verbose_name.rjust(maximum_length)
         if key in multi_value_keys and isinstance(value, (list, set, tuple)):
-            if isinstance(value, tuple):
-                value = list(value)
             if len(value) == 1:
-                value = value.pop()
-                rendered.append(f"{verbose_name:>{maximum_length}}: {value}")
+                rendered.append(f"{name}: {next(iter(value))}")
             elif not value:
-                rendered.append(f"{verbose_name:>{maximum_length}}:")
+                rendered.append(f"{name}:")
             else:
-                value = "\n" + "\n".join(map(lambda x: " " * maximum_length + f"   * {x}", sorted(value)))
-                rendered.append(f"{verbose_name:>{maximum_length}}:{value}")
+                rendered.append(f"{name}:")
+                rendered.extend([f"{indentation}{x}" for x in sorted(value)])
         else:
-            rendered.append(f"{verbose_name:>{maximum_length}}: {value}")
+            rendered.append(f"{name}: {value}")
     return "\n".join(rendered)
@@ -4,49 +4,112 @@
 
 from __future__ import annotations
 
-import atexit
+import functools
+import hashlib
+import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from importlib.resources import files, as_file
 from pathlib import Path
-from tempfile import mkdtemp, NamedTemporaryFile
-from typing import Generator
+from tempfile import mkdtemp
+from typing import Generator, Iterable
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-CACHE_DIRECTORY = Path(mkdtemp())
+if sys.platform != "win32":
+    import fcntl
 
-atexit.register(shutil.rmtree, CACHE_DIRECTORY)
 
+# The downloaded files are kept between the test runs. They are not verified again afterwards,
+# thus delete this directory to download them again if a file changed or has been broken.
+CACHE_DIRECTORY = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "license_tools_tests"
 
-@dataclass
+FILES_DIRECTORY = files("tests") / "files"
+
+
+@dataclass(frozen=True)
 class Download:
     url: str
     name: str
     suffix: str
 
 
+@functools.lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    from license_tools.utils.download_utils import get_session
+    session = get_session()
+    adapter = HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
 def _get_or_download(download: Download) -> Path:
-    path = CACHE_DIRECTORY / download.name
+    # Key the cache by the URL to share the files between downloads of the same URL.
+    path = CACHE_DIRECTORY / hashlib.blake2b(download.url.encode(), digest_size=16).hexdigest()
     if path.is_file():
         return path
-    from license_tools.utils.download_utils import get_session
-    session = get_session()
-    path.write_bytes(session.get(url=download.url).content)
+    CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    # Let parallel test processes wait for a running download instead of repeating it.
+    lock_path = path.with_name(f".{path.name}.lock")
+    with open(lock_path, mode="w") as lock_file:
+        if sys.platform != "win32":
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if not path.is_file():
+            # Use a temporary name to never expose partial downloads.
+            temporary_path = path.with_name(f".{path.name}.part")
+            with _get_session().get(url=download.url, timeout=(5, 30), stream=True) as response:
+                response.raise_for_status()
+                with open(temporary_path, mode="wb") as file_object:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        file_object.write(chunk)
+            temporary_path.replace(path)
+    # Processes still waiting for the lock find the file afterwards, thus it is not required any more.
+    lock_path.unlink(missing_ok=True)
     return path
 
 
+def prime_cache(downloads: Iterable[Download]) -> None:
+    # Download the files required by a test module in parallel, sharing the pooled session.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_get_or_download, download) for download in downloads]
+    for future in futures:
+        # Failures are not cached, thus the affected tests will retry and report them.
+        future.exception()
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    # The cached files are not modified by the tests, thus a hard link is sufficient.
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
 @contextmanager
-def get_from_url(download: Download) -> Generator[Path, None, None]:
-    with NamedTemporaryFile(suffix=download.suffix) as temp_file:
-        path = Path(temp_file.name)
-        source_path = _get_or_download(download)
-        shutil.copy2(source_path, path)
+def get_from_url_readonly(download: Download) -> Generator[Path, None, None]:
+    # Avoid the per-test copy for tests which only read the file. The cached file
+    # is shared between the tests and therefore must not be modified.
+    source_path = _get_or_download(download)
+    # The cache uses opaque names, thus provide the file with its actual name and suffix.
+    # Symbolic links are not sufficient, as `extractcode` ignores them.
+    directory = Path(mkdtemp())
+    try:
+        path = directory / download.name
+        _link_or_copy(source_path, path)
         yield path
+    finally:
+        shutil.rmtree(directory)
 
 
 @contextmanager
 def get_file(name: str) -> Generator[Path, None, None]:
-    reference = files("tests") / "files" / name
+    reference = FILES_DIRECTORY / name
     with as_file(reference) as path:
         yield path
@@ -7,19 +7,21 @@ from __future__ import annotations
 import copy
 import os
 import re
+import shutil
 import tarfile
 from contextlib import contextmanager, redirect_stdout
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import Any, cast, Generator
+from tempfile import mkdtemp, TemporaryDirectory
+from types import MappingProxyType
+from typing import Any, BinaryIO, Generator
 from unittest import mock, TestCase
 
 from license_tools import retrieval
 from license_tools.retrieval import RetrievalFlags
 from license_tools.tools.scancode_tools import FileResults, LicenseDetection, LicenseMatch, Licenses
 from license_tools.utils.path_utils import get_files_from_directory
-from tests import Download, get_from_url
+from tests import Download, get_from_url_readonly, prime_cache
 from tests.data import (
     BASE64__0_22_0__CARGO_TOML,
     LIBAIO1__0_3_109_1_25__RPM,
@@ -34,6 +36,85 @@ from tests.data import (
 )
 
 
+TEMPORARY_DIRECTORY_REGEX = re.compile(r"/tmp/tmp[^/]+")
+
+
+# The keyword arguments passed to `FileResults` when all of its retrieval options are enabled.
+ALL_FILE_RESULTS_KWARGS = MappingProxyType(
+    dict(
+        retrieve_licenses=True,
+        retrieve_copyrights=True,
+        retrieve_emails=True,
+        retrieve_file_info=True,
+        retrieve_urls=True,
+    )
+)
+
+LDD_USR_BIN_BC = """    linux-vdso.so.1 (0x00007fff30abf000)
+    libreadline.so.7 => /lib64/libreadline.so.7 (0x00007fbe48c00000)
+    libc.so.6 => /lib64/libc.so.6 (0x00007fbe48a09000)
+    libtinfo.so.6 => /lib64/libtinfo.so.6 (0x00007fbe48600000)
+    /lib64/ld-linux-x86-64.so.2 (0x00007fbe492b8000)
+"""
+
+EXPECTED_LDD_USR_BIN_BC_STDOUT = "setup.py\n" + LDD_USR_BIN_BC + "\n"
+
+FONT_AWESOME_SOLID = """             Copyright notice: Copyright (c) Font Awesome
+          Font family name: Font Awesome 6 Free Solid
+       Font subfamily name: Solid
+    Unique font identifier: Font Awesome 6 Free Solid-6.5.1
+            Full font name: Font Awesome 6 Free Solid
+            Version string: Version 773.01171875 (Font Awesome version: 6.5.1)
+           PostScript name: FontAwesome6Free-Solid
+               Description: The web's most popular icon set and toolkit.
+                URL Vendor: https://fontawesome.com
+   Typographic Family name: Font Awesome 6 Free
+Typographic Subfamily name: Solid
+"""
+
+EXPECTED_FONT_AWESOME_SOLID_STDOUT = "setup.py\n" + FONT_AWESOME_SOLID + "\n\n"
+
+MOUNTAIN_JPG = """[File]          File Name                       : mountain.jpg
+[File]          File Size                       : 424 kB
+[File]          File Modification Date/Time     : 2024:10:22 14:54:14+00:00
+[File]          File Permissions                : -rw-r--r--
+[File]          File Type                       : JPEG
+[File]          File Type Extension             : jpg
+[File]          MIME Type                       : image/jpeg
+"""
+
+EXPECTED_MOUNTAIN_JPG_STDOUT = "setup.py\n" + MOUNTAIN_JPG + "\n"
+
+
+def setUpModule() -> None:
+    prime_cache(
+        [
+            BASE64__0_22_0__CARGO_TOML,
+            LIBAIO1__0_3_109_1_25__RPM,
+            TYPING_EXTENSIONS__4_8_0__SDIST,
+            TYPING_EXTENSIONS__4_8_0__WHEEL,
+        ]
+    )
+
+
+class DummyFileResult:
+    licenses = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@contextmanager
+def mock_pip_download(download: Download) -> Generator[mock.MagicMock, None, None]:
+    # Provide the cached file instead of running `pip download` for each test.
+    def run(command: list[str], **kwargs: Any) -> None:
+        destination = Path(command[command.index("--dest") + 1])
+        shutil.copyfile(path, destination / download.name)
+
+    with get_from_url_readonly(download) as path, mock.patch("subprocess.run", side_effect=run) as run_mock:
+        yield run_mock
+
+
 class RetrievalFlagsTestCase(TestCase):
     def test_to_int(self) -> None:
         self.assertEqual(0, RetrievalFlags.to_int())
@@ -55,7 +136,7 @@ class RetrievalFlagsTestCase(TestCase):
                 retrieve_cargo_metadata=True,
                 retrieve_image_metadata=True,
             ),
-            cast(dict[str, bool], RetrievalFlags.all(as_kwargs=True)),
+            RetrievalFlags.all(as_kwargs=True),
         )
 
     def test_is_set(self) -> None:
@@ -96,6 +177,17 @@ class RetrievalFlagsTestCase(TestCase):
 
 
 class RunOnFileTestCase(TestCase):
+    def _start_patch(self, target: str) -> mock.Mock:
+        # Keep the patches active for the whole test instead of entering them again for each call.
+        if target not in self._patches:
+            patcher = mock.patch(target)
+            self._patches[target] = patcher.start()
+            self.addCleanup(patcher.stop)
+        return self._patches[target]
+
+    def setUp(self) -> None:
+        self._patches: dict[str, mock.Mock] = {}
+
     def _run_mocked(
         self,
         flags: int,
@@ -103,206 +195,81 @@ class RunOnFileTestCase(TestCase):
         return_value: str | None = "",
     ) -> tuple[mock.Mock, mock.Mock, str]:
         stdout = StringIO()
-
-        class DummyFileResult:
-            licenses = None
-
-            def __init__(self, *args: Any, **kwargs: Any) -> None:
-                pass
-
         file_result = DummyFileResult()
-        with mock.patch.object(
-            retrieval, "FileResults", return_value=file_result
-        ) as results_mock, redirect_stdout(stdout), mock.patch(
-            mock_target, return_value=return_value
-        ) as check_mock:
+        results_mock = self._start_patch("license_tools.retrieval.FileResults")
+        results_mock.reset_mock()
+        results_mock.return_value = file_result
+        check_mock = self._start_patch(mock_target)
+        check_mock.reset_mock()
+        check_mock.return_value = return_value
+        with redirect_stdout(stdout):
             result = retrieval.run_on_file(
                 path=SETUP_PATH, short_path="setup.py", retrieval_flags=flags
             )
             self.assertEqual(file_result, result)
         return results_mock, check_mock, stdout.getvalue()
 
-    def test_run_on_file__ldd_handling(self) -> None:
-        # 1) LDD handling is inactive.
-        results_mock, check_mock, stdout = self._run_mocked(
-            flags=15, mock_target="license_tools.tools.linking_tools.check_shared_objects"
-        )
-        check_mock.assert_not_called()
-        results_mock.assert_called_once_with(
-            path=SETUP_PATH,
-            short_path="setup.py",
-            retrieve_licenses=True,
-            retrieve_copyrights=True,
-            retrieve_emails=True,
-            retrieve_file_info=True,
-            retrieve_urls=True,
-        )
-        self.assertEqual("", stdout)
+    def _check_handling(self, active_flags: int, mock_target: str, output: str, expected_stdout: str) -> None:
+        # 1) Handling is inactive.
+        with self.subTest(phase="inactive"):
+            results_mock, check_mock, stdout = self._run_mocked(flags=15, mock_target=mock_target)
+            check_mock.assert_not_called()
+            results_mock.assert_called_once_with(
+                path=SETUP_PATH, short_path="setup.py", **ALL_FILE_RESULTS_KWARGS
+            )
+            self.assertEqual("", stdout)
 
-        # 2) LDD handling is active, but has no results.
+        # 2) Handling is active, but has no results.
         for result in ["", None]:
-            with self.subTest(result=result):
+            with self.subTest(phase="empty", result=result):
                 results_mock, check_mock, stdout = self._run_mocked(
-                    flags=31,
-                    return_value=result,
-                    mock_target="license_tools.tools.linking_tools.check_shared_objects",
+                    flags=active_flags, return_value=result, mock_target=mock_target
                 )
                 check_mock.assert_called_once_with(path=SETUP_PATH)
                 results_mock.assert_called_once_with(
-                    path=SETUP_PATH,
-                    short_path="setup.py",
-                    retrieve_licenses=True,
-                    retrieve_copyrights=True,
-                    retrieve_emails=True,
-                    retrieve_file_info=True,
-                    retrieve_urls=True,
+                    path=SETUP_PATH, short_path="setup.py", **ALL_FILE_RESULTS_KWARGS
                 )
                 self.assertEqual("", stdout)
 
-        # 3) LDD handling is active and has results.
-        ldd_usr_bin_bc = """    linux-vdso.so.1 (0x00007fff30abf000)
-    libreadline.so.7 => /lib64/libreadline.so.7 (0x00007fbe48c00000)
-    libc.so.6 => /lib64/libc.so.6 (0x00007fbe48a09000)
-    libtinfo.so.6 => /lib64/libtinfo.so.6 (0x00007fbe48600000)
-    /lib64/ld-linux-x86-64.so.2 (0x00007fbe492b8000)
-"""
-        results_mock, check_mock, stdout = self._run_mocked(
-            flags=31,
-            return_value=ldd_usr_bin_bc,
+        # 3) Handling is active and has results.
+        with self.subTest(phase="results"):
+            results_mock, check_mock, stdout = self._run_mocked(
+                flags=active_flags, return_value=output, mock_target=mock_target
+            )
+            check_mock.assert_called_once_with(path=SETUP_PATH)
+            results_mock.assert_called_once_with(
+                path=SETUP_PATH,
+                short_path="setup.py",
+            )
+            self.assertEqual(expected_stdout, stdout)
+
+    def test_run_on_file__ldd_handling(self) -> None:
+        self._check_handling(
+            active_flags=31,
             mock_target="license_tools.tools.linking_tools.check_shared_objects",
+            output=LDD_USR_BIN_BC,
+            expected_stdout=EXPECTED_LDD_USR_BIN_BC_STDOUT,
         )
-        check_mock.assert_called_once_with(path=SETUP_PATH)
-        results_mock.assert_called_once_with(
-            path=SETUP_PATH,
-            short_path="setup.py",
-        )
-        self.assertEqual("setup.py\n" + ldd_usr_bin_bc + "\n", stdout)
 
     def test_run_on_file__font_handling(self) -> None:
-        # 1) Font handling is inactive.
-        results_mock, check_mock, stdout = self._run_mocked(
-            flags=15, mock_target="license_tools.tools.font_tools.check_font"
-        )
-        check_mock.assert_not_called()
-        results_mock.assert_called_once_with(
-            path=SETUP_PATH,
-            short_path="setup.py",
-            retrieve_licenses=True,
-            retrieve_copyrights=True,
-            retrieve_emails=True,
-            retrieve_file_info=True,
-            retrieve_urls=True,
-        )
-        self.assertEqual("", stdout)
-
-        # 2) Font handling is active, but has no results.
-        for result in ["", None]:
-            with self.subTest(result=result):
-                results_mock, check_mock, stdout = self._run_mocked(
-                    flags=63,
-                    return_value=result,
-                    mock_target="license_tools.tools.font_tools.check_font",
-                )
-                check_mock.assert_called_once_with(path=SETUP_PATH)
-                results_mock.assert_called_once_with(
-                    path=SETUP_PATH,
-                    short_path="setup.py",
-                    retrieve_licenses=True,
-                    retrieve_copyrights=True,
-                    retrieve_emails=True,
-                    retrieve_file_info=True,
-                    retrieve_urls=True,
-                )
-                self.assertEqual("", stdout)
-
-        # 3) Font handling is active and has results.
-        font_awesome = """             Copyright notice: Copyright (c) Font Awesome
-          Font family name: Font Awesome 6 Free Solid
-       Font subfamily name: Solid
-    Unique font identifier: Font Awesome 6 Free Solid-6.5.1
-            Full font name: Font Awesome 6 Free Solid
-            Version string: Version 773.01171875 (Font Awesome version: 6.5.1)
-           PostScript name: FontAwesome6Free-Solid
-               Description: The web's most popular icon set and toolkit.
-                URL Vendor: https://fontawesome.com
-   Typographic Family name: Font Awesome 6 Free
-Typographic Subfamily name: Solid
-"""
-        results_mock, check_mock, stdout = self._run_mocked(
-            flags=63,
-            return_value=font_awesome,
+        self._check_handling(
+            active_flags=63,
             mock_target="license_tools.tools.font_tools.check_font",
+            output=FONT_AWESOME_SOLID,
+            expected_stdout=EXPECTED_FONT_AWESOME_SOLID_STDOUT,
         )
-        check_mock.assert_called_once_with(path=SETUP_PATH)
-        results_mock.assert_called_once_with(
-            path=SETUP_PATH,
-            short_path="setup.py",
-        )
-        self.assertEqual("setup.py\n" + font_awesome + "\n\n", stdout)
 
     def test_run_on_file__image_handling(self) -> None:
-        # 1) Image handling is inactive.
-        results_mock, check_mock, stdout = self._run_mocked(
-            flags=15, mock_target="license_tools.tools.image_tools.check_image_metadata"
-        )
-        check_mock.assert_not_called()
-        results_mock.assert_called_once_with(
-            path=SETUP_PATH,
-            short_path="setup.py",
-            retrieve_licenses=True,
-            retrieve_copyrights=True,
-            retrieve_emails=True,
-            retrieve_file_info=True,
-            retrieve_urls=True,
-        )
-        self.assertEqual("", stdout)
-
-        # 2) Image handling is active, but has no results.
-        for result in ["", None]:
-            with self.subTest(result=result):
-                results_mock, check_mock, stdout = self._run_mocked(
-                    flags=511,
-                    return_value=result,
-                    mock_target="license_tools.tools.image_tools.check_image_metadata",
-                )
-                check_mock.assert_called_once_with(path=SETUP_PATH)
-                results_mock.assert_called_once_with(
-                    path=SETUP_PATH,
-                    short_path="setup.py",
-                    retrieve_licenses=True,
-                    retrieve_copyrights=True,
-                    retrieve_emails=True,
-                    retrieve_file_info=True,
-                    retrieve_urls=True,
-                )
-                self.assertEqual("", stdout)
-
-        # 3) Image handling is active and has results.
-        mountain_jpg = """[File]          File Name                       : mountain.jpg
-[File]          File Size                       : 424 kB
-[File]          File Modification Date/Time     : 2024:10:22 14:54:14+00:00
-[File]          File Permissions                : -rw-r--r--
-[File]          File Type                       : JPEG
-[File]          File Type Extension             : jpg
-[File]          MIME Type                       : image/jpeg
-"""
-        results_mock, check_mock, stdout = self._run_mocked(
-            flags=511,
-            return_value=mountain_jpg,
+        self._check_handling(
+            active_flags=511,
             mock_target="license_tools.tools.image_tools.check_image_metadata",
+            output=MOUNTAIN_JPG,
+            expected_stdout=EXPECTED_MOUNTAIN_JPG_STDOUT,
         )
-        check_mock.assert_called_once_with(path=SETUP_PATH)
-        results_mock.assert_called_once_with(
-            path=SETUP_PATH,
-            short_path="setup.py",
-        )
-        self.assertEqual("setup.py\n" + mountain_jpg + "\n", stdout)
 
     def test_cargo_toml(self) -> None:
-        with get_from_url(BASE64__0_22_0__CARGO_TOML) as source_path, TemporaryDirectory() as directory:
-            cargo_toml_path = Path(directory) / "Cargo.toml"
-            cargo_toml_path.write_bytes(source_path.read_bytes())
-
+        # The read-only copy already is a `Cargo.toml` file inside its own directory.
+        with get_from_url_readonly(BASE64__0_22_0__CARGO_TOML) as cargo_toml_path:
             stdout = StringIO()
             with redirect_stdout(stdout):
                 retrieval.run_on_file(path=cargo_toml_path, short_path="/path/to/Cargo.toml")
@@ -366,17 +333,44 @@ Typographic Subfamily name: Solid
 
 
 class RunOnDirectoryTestCase(TestCase):
-    def test_run_on_directory(self) -> None:
-        file_results = [object()] * 5
-        file_results_iterable = iter(file_results)
-        paths = [(Path(f"/tmp/file{i}.py"), f"file{i}.py") for i in range(1, 6)]
+    FILE_PATHS = [(Path(f"/tmp/file{i}.py"), f"file{i}.py") for i in range(1, 6)]
+
+    nested_archive_path: Path
+    nested_path: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Create the archive only once and copy it for each test.
+        directory = Path(mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, directory)
+        cls.nested_path = Path(mkdtemp(dir=directory))
+        cls.nested_path.joinpath("LICENSE").write_text("This is my license.")
+        cls.nested_archive_path = directory / "nested.tar"
+        with tarfile.open(cls.nested_archive_path, "w") as tar:
+            tar.add(cls.nested_path, arcname=cls.nested_path.name)
+
+    def setUp(self) -> None:
+        # By default, the mocked `run_on_file` returns the paths instead of the results.
+        patcher = mock.patch.object(retrieval, "run_on_file", side_effect=lambda path, **kwargs: path)
+        self.run_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _assert_run_on_file_calls(self, paths: list[tuple[Path, str]]) -> None:
+        self.run_mock.assert_has_calls(
+            [
+                mock.call(path=path, short_path=short_path, retrieval_flags=42)
+                for path, short_path in paths
+            ],
+            any_order=False,
+        )
+        self.assertEqual(len(paths), self.run_mock.call_count, self.run_mock.call_args_list)
 
-        def run_on_file(path: Path, short_path: str, retrieval_flags: int = 0) -> Any:
-            return next(file_results_iterable)
+    def test_run_on_directory(self) -> None:
+        file_results = list(range(5))
+        paths = self.FILE_PATHS
 
+        self.run_mock.side_effect = file_results
         with mock.patch.object(
-            retrieval, "run_on_file", side_effect=run_on_file
-        ) as run_mock, mock.patch.object(
             retrieval, "get_files_from_directory", return_value=paths
         ) as get_mock:
             results = list(
@@ -385,81 +379,54 @@ class RunOnDirectoryTestCase(TestCase):
                 )
             )
         self.assertListEqual(file_results, results)
-        run_mock.assert_has_calls(
-            [
-                mock.call(
-                    path=current_path, short_path=current_short_path, retrieval_flags=42
-                )
-                for current_path, current_short_path in paths
-            ],
-            any_order=False,
-        )
-        self.assertEqual(len(paths), run_mock.call_count, run_mock.call_args_list)
+        self._assert_run_on_file_calls(paths=paths)
         get_mock.assert_called_once_with("/tmp/dummy/directory", None)
 
     @classmethod
-    def _generate_tar_bz2_archive(cls, directory: Path) -> Path:
-        with TemporaryDirectory() as nested_directory:
-            nested_path = Path(nested_directory)
-            nested_path.joinpath("LICENSE").write_text("This is my license.")
-            with tarfile.open(directory / "nested.tar.bz2", "w:bz2") as tar:
-                tar.add(nested_path, arcname=nested_path.name)
-        return nested_path
+    def _copy_nested_tar(cls, directory: Path) -> Path:
+        shutil.copyfile(cls.nested_archive_path, directory / "nested.tar")
+        return cls.nested_path
 
     def _test_nested(
-            self, result_set: set[Path], directory: Path, nested_path: Path, expected: list[tuple[Path, str]], run_mock: mock.Mock
+            self, result_set: set[Path], directory: Path, nested_path: Path, expected: list[tuple[Path, str]]
     ) -> None:
         self.assertEqual(1, len(result_set), result_set)
         remaining = result_set.pop()
         self.assertEqual(directory, remaining.parent.parent.parent)
         self.assertEqual(nested_path.name, remaining.parent.name)
         self.assertEqual("LICENSE", remaining.name)
-        expected.append((remaining, "/".join(str(remaining).rsplit("/", maxsplit=3)[1:])))
+        expected.append((remaining, remaining.relative_to(directory).as_posix()))
 
-        run_mock.assert_has_calls(
-            [
-                mock.call(
-                    path=current_path, short_path=current_short_path, retrieval_flags=42
-                )
-                for current_path, current_short_path in expected
-            ],
-            any_order=False,
-        )
-        self.assertEqual(len(expected), run_mock.call_count, run_mock.call_args_list)
+        self._assert_run_on_file_calls(paths=expected)
 
     def test_nested_with_existing_directory(self) -> None:
         with TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             directory.joinpath("directory").mkdir()
             directory.joinpath("directory", "file.txt").write_text("MIT-0")
-            directory.joinpath("nested_tar_bz2").write_text("Dummy")
-            nested_path = self._generate_tar_bz2_archive(directory)
+            directory.joinpath("nested_tar").write_text("Dummy")
+            nested_path = self._copy_nested_tar(directory)
 
-            def run_on_file(path: Path, short_path: str, retrieval_flags: int = 0) -> Any:
-                return path
-
-            with mock.patch.object(
-                retrieval, "run_on_file", side_effect=run_on_file
-            ) as run_mock:
-                results = list(
-                    retrieval.run_on_directory(
-                        tempdir, job_count=1, retrieval_flags=42
-                    )
+            # The mocked `run_on_file` returns the paths instead of the results.
+            result_set: set[Any] = set(
+                retrieval.run_on_directory(
+                    tempdir, job_count=1, retrieval_flags=42
                 )
+            )
 
             self.assertSetEqual(
-                {"directory", "nested_tar_bz2", "nested.tar.bz2"},
+                {"directory", "nested_tar", "nested.tar"},
                 {path.name for path in directory.glob("*")}
             )
 
-        result_set: set[Path] = cast(set[Path], set(results))
+        # The paths are unique, thus the call count is covered by `_assert_run_on_file_calls`.
         expected: list[tuple[Path, str]] = []
-        self.assertEqual(4, len(results), results)
-        for name in ["directory/file.txt", "nested.tar.bz2", "nested_tar_bz2"]:
+        self.assertEqual(4, len(result_set), result_set)
+        for name in ["directory/file.txt", "nested.tar", "nested_tar"]:
             result_set.remove(directory / name)
             expected.append((directory / name, name))
         self._test_nested(
-            result_set=result_set, directory=directory, nested_path=nested_path, expected=expected, run_mock=run_mock
+            result_set=result_set, directory=directory, nested_path=nested_path, expected=expected
         )
 
     def test_nested_without_existing_directory(self) -> None:
@@ -467,33 +434,28 @@ class RunOnDirectoryTestCase(TestCase):
             directory = Path(tempdir)
             directory.joinpath("directory").mkdir()
             directory.joinpath("directory", "file.txt").write_text("MIT-0")
-            nested_path = self._generate_tar_bz2_archive(directory)
-
-            def run_on_file(path: Path, short_path: str, retrieval_flags: int = 0) -> Any:
-                return path
+            nested_path = self._copy_nested_tar(directory)
 
-            with mock.patch.object(
-                retrieval, "run_on_file", side_effect=run_on_file
-            ) as run_mock:
-                results = list(
-                    retrieval.run_on_directory(
-                        tempdir, job_count=1, retrieval_flags=42
-                    )
+            # The mocked `run_on_file` returns the paths instead of the results.
+            result_set: set[Any] = set(
+                retrieval.run_on_directory(
+                    tempdir, job_count=1, retrieval_flags=42
                 )
+            )
 
             self.assertSetEqual(
-                {"directory", "nested.tar.bz2"},
+                {"directory", "nested.tar"},
                 {path.name for path in directory.glob("*")}
             )
 
-        result_set: set[Path] = cast(set[Path], set(results))
+        # The paths are unique, thus the call count is covered by `_assert_run_on_file_calls`.
         expected: list[tuple[Path, str]] = []
-        self.assertEqual(3, len(results), results)
-        for name in ["directory/file.txt", "nested.tar.bz2"]:
+        self.assertEqual(3, len(result_set), result_set)
+        for name in ["directory/file.txt", "nested.tar"]:
             result_set.remove(directory / name)
             expected.append((directory / name, name))
         self._test_nested(
-            result_set=result_set, directory=directory, nested_path=nested_path, expected=expected, run_mock=run_mock
+            result_set=result_set, directory=directory, nested_path=nested_path, expected=expected
         )
 
     def test_nested_storage_variant(self) -> None:
@@ -501,12 +463,26 @@ class RunOnDirectoryTestCase(TestCase):
             directory = Path(tempdir)
             directory.joinpath("directory").mkdir()
             directory.joinpath("directory", "file.txt").write_text("MIT-0")
-            _ = self._generate_tar_bz2_archive(directory)
+            _ = self._copy_nested_tar(directory)
+            file_exists_regex = re.compile(fr"^\[Errno 17\] File exists: '{re.escape(str(directory / 'nested_tar'))}'$")
 
-            def run_on_file(path: Path, short_path: str, retrieval_flags: int = 0) -> Any:
-                return path
+            list(
+                retrieval.run_on_directory(
+                    tempdir, job_count=1, retrieval_flags=42,
+                    allow_random_directory_for_archive=False,
+                    delete_unpacked_archive_directories=False,
+                )
+            )
 
-            with mock.patch.object(retrieval, "run_on_file", side_effect=run_on_file):
+            self.assertSetEqual(
+                {"directory", "nested.tar", "nested_tar"},
+                {path.name for path in directory.glob("*")}
+            )
+
+            with self.assertRaisesRegex(
+                    expected_exception=FileExistsError,
+                    expected_regex=file_exists_regex
+            ):
                 list(
                     retrieval.run_on_directory(
                         tempdir, job_count=1, retrieval_flags=42,
@@ -515,28 +491,10 @@ class RunOnDirectoryTestCase(TestCase):
                     )
                 )
 
-            self.assertSetEqual(
-                {"directory", "nested.tar.bz2", "nested_tar_bz2"},
-                {path.name for path in directory.glob("*")}
-            )
-
-            with mock.patch.object(retrieval, "run_on_file", side_effect=run_on_file):
-                with self.assertRaisesRegex(
-                        expected_exception=FileExistsError,
-                        expected_regex=fr"^\[Errno 17\] File exists: '{re.escape(str(directory / 'nested_tar_bz2'))}'$"
-                ):
-                    list(
-                        retrieval.run_on_directory(
-                            tempdir, job_count=1, retrieval_flags=42,
-                            allow_random_directory_for_archive=False,
-                            delete_unpacked_archive_directories=False,
-                        )
-                    )
-
 
 class RunOnPackageArchiveFileTestCase(TestCase):
     def _check_call(self, download: Download, expected_files: list[str], expected_license: str | None = None) -> None:
-        with get_from_url(download) as archive_path:
+        with get_from_url_readonly(download) as archive_path:
             directory_result = [object(), object(), object()]
 
             def run_on_directory(
@@ -601,17 +559,24 @@ class RunOnDownloadedArchiveFileTestCase(TestCase):
             self.assertEqual(download.suffix, archive_path.name[-len(download.suffix):])
             yield from directory_result
 
+        def download_file(url: str, file_object: BinaryIO) -> None:
+            # Provide the cached file instead of downloading it again.
+            with get_from_url_readonly(download) as path, open(path, mode="rb") as source:
+                shutil.copyfileobj(source, file_object)
+            file_object.seek(0)
+
         with mock.patch.object(
             retrieval,
             "run_on_package_archive_file",
             side_effect=run_on_package_archive_file,
-        ):
+        ), mock.patch.object(retrieval, "download_file", side_effect=download_file) as download_mock:
             result = list(
                 retrieval.run_on_downloaded_archive_file(
                     download_url=download.url, job_count=2, retrieval_flags=42
                 )
             )
         self.assertEqual(directory_result, result)
+        download_mock.assert_called_once_with(url=download.url, file_object=mock.ANY)
 
     def test_wheel_file(self) -> None:
         self._check_call(download=TYPING_EXTENSIONS__4_8_0__WHEEL)
@@ -630,14 +595,14 @@ class RunOnDownloadedPackageFileTestCase(TestCase):
             self.assertEqual("typing_extensions-4.8.0-py3-none-any.whl", archive_path.name)
             self.assertEqual(3, job_count)
             self.assertEqual(42, retrieval_flags)
-            self.assertEqual(31584, len(archive_path.read_bytes()))
+            self.assertEqual(31584, archive_path.stat().st_size)
             yield from archive_result
 
         with mock.patch.object(
             retrieval,
             "run_on_package_archive_file",
             side_effect=run_on_package_archive_file,
-        ):
+        ), mock_pip_download(TYPING_EXTENSIONS__4_8_0__WHEEL) as run_mock:
             result = list(
                 retrieval.run_on_downloaded_package_file(
                     package_definition="typing_extensions==4.8.0",
@@ -647,6 +612,8 @@ class RunOnDownloadedPackageFileTestCase(TestCase):
                 )
             )
             self.assertEqual(archive_result, result)
+        run_mock.assert_called_once()
+        self.assertIn("typing_extensions==4.8.0", run_mock.call_args.args[0])
 
     def test_prefer_source_distribution(self) -> None:
         archive_result = [object(), object(), object()]
@@ -657,14 +624,14 @@ class RunOnDownloadedPackageFileTestCase(TestCase):
             self.assertEqual("typing_extensions-4.8.0.tar.gz", archive_path.name)
             self.assertEqual(3, job_count)
             self.assertEqual(42, retrieval_flags)
-            self.assertEqual(71456, len(archive_path.read_bytes()))
+            self.assertEqual(71456, archive_path.stat().st_size)
             yield from archive_result
 
         with mock.patch.object(
             retrieval,
             "run_on_package_archive_file",
             side_effect=run_on_package_archive_file,
-        ):
+        ), mock_pip_download(TYPING_EXTENSIONS__4_8_0__SDIST) as run_mock:
             result = list(
                 retrieval.run_on_downloaded_package_file(
                     package_definition="typing_extensions==4.8.0",
@@ -675,6 +642,8 @@ class RunOnDownloadedPackageFileTestCase(TestCase):
                 )
             )
             self.assertEqual(archive_result, result)
+        run_mock.assert_called_once()
+        self.assertIn("typing_extensions==4.8.0", run_mock.call_args.args[0])
 
 
 class CheckThatExactlyOneValueIsSetTestCase(TestCase):
@@ -689,22 +658,45 @@ class CheckThatExactlyOneValueIsSetTestCase(TestCase):
         )
 
 
-class Stdout:
-    def __init__(self) -> None:
-        self.stdout = StringIO()
-
-    def __str__(self) -> str:
-        return self.stdout.getvalue()
+class RunTestCase(TestCase):
+    nested_archive_path: Path
+    archive_directory_path: Path
+    nested_path: Path
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The archive is not modified by the analysis, thus create it only once.
+        # The compression level is irrelevant for the tests, thus prefer speed.
+        directory = Path(mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, directory)
+        cls.archive_directory_path = Path(mkdtemp(dir=directory))
+        cls.archive_directory_path.joinpath("directory1", "directory2").mkdir(parents=True)
+        cls.archive_directory_path.joinpath("directory1", "directory2", "file.txt").write_text("MIT-0")
+        cls.archive_directory_path.joinpath("directory1", "directory2", "file2.txt").write_text("Apache-2.0")
+        cls.nested_path = Path(mkdtemp(dir=directory))
+        cls.nested_path.joinpath("subdirectory").mkdir()
+        cls.nested_path.joinpath("subdirectory", "README").write_text("CC-BY-2.0")
+        cls.nested_path.joinpath("LICENSE").write_text("This is my license.")
+        # The inner archive is only required as a member of the outer one, thus keep it in memory.
+        nested_archive = BytesIO()
+        with tarfile.open(fileobj=nested_archive, mode="w:bz2", compresslevel=1) as tar:
+            tar.add(cls.nested_path, arcname=cls.nested_path.name)
+
+        cls.nested_archive_path = directory / "archive.tar.gz"
+        with tarfile.open(cls.nested_archive_path, "w:gz", compresslevel=1) as tar:
+            tar.add(cls.archive_directory_path, arcname=cls.archive_directory_path.name)
+            info = tarfile.TarInfo(name=f"{cls.archive_directory_path.name}/nested.tar.bz2")
+            info.size = nested_archive.tell()
+            nested_archive.seek(0)
+            tar.addfile(info, nested_archive)
 
-class RunTestCase(TestCase):
     @contextmanager
-    def record_stdout(self) -> Generator[Stdout, None, None]:
-        result = Stdout()
+    def record_stdout(self) -> Generator[StringIO, None, None]:
+        stdout = StringIO()
         with mock.patch(
             "shutil.get_terminal_size", return_value=os.terminal_size((100, 20))
-        ), redirect_stdout(result.stdout):
-            yield result
+        ), redirect_stdout(stdout):
+            yield stdout
 
     def test_package_definition(self) -> None:
         with self.record_stdout() as stdout:
@@ -725,18 +717,19 @@ class RunTestCase(TestCase):
             prefer_sdist=False,
         )
         self.assertEqual(TYPING_EXTENSION_4_8_0__LICENSES, result)
-        self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, str(stdout))
+        self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, stdout.getvalue())
 
     def test_package_definition__with_metadata(self) -> None:
         self.maxDiff = None
-        with self.record_stdout() as stdout:
+        with self.record_stdout() as stdout, mock_pip_download(TYPING_EXTENSIONS__4_8_0__WHEEL):
             result = retrieval.run(
                 package_definition="typing_extensions==4.8.0",
                 index_url="https://pypi.org/simple",
                 retrieve_python_metadata=True,
             )
 
-        expected_result = copy.deepcopy(TYPING_EXTENSION_4_8_0__LICENSES)
+        # Only the top-level attributes are changed, thus a shallow copy of each entry is sufficient.
+        expected_result = [copy.copy(entry) for entry in TYPING_EXTENSION_4_8_0__LICENSES]
         for entry in expected_result:
             entry.path = Path("dummy")
             entry.retrieve_licenses = True
@@ -756,7 +749,7 @@ License classifiers: Python Software Foundation License
        Requirements:
 
 """ + TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT
-        self.assertEqual(expected_output, re.sub(pattern=r"/tmp/tmp[^/]+", repl="/tmp/dummy", string=str(stdout)))
+        self.assertEqual(expected_output, TEMPORARY_DIRECTORY_REGEX.sub(repl="/tmp/dummy", string=stdout.getvalue()))
 
     def test_directory(self) -> None:
         with TemporaryDirectory() as directory:
@@ -769,10 +762,10 @@ License classifiers: Python Software Foundation License
                 ) as run_mock:
                     result = retrieval.run(directory=path, retrieve_ldd_data=True)
             run_mock.assert_called_once_with(
-                directory=directory, retrieval_flags=16, job_count=4
+                directory=directory, retrieval_flags=RetrievalFlags.LDD_DATA, job_count=4
             )
             self.assertEqual(TYPING_EXTENSION_4_8_0__LICENSES, result)
-            self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, str(stdout))
+            self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, stdout.getvalue())
 
     def test_archive_path(self) -> None:
         with self.record_stdout() as stdout:
@@ -788,11 +781,11 @@ License classifiers: Python Software Foundation License
                 )
         run_mock.assert_called_once_with(
             archive_path=Path("/tmp/dummy/typing_extensions-4.8.0.tar.gz"),
-            retrieval_flags=1,
+            retrieval_flags=RetrievalFlags.COPYRIGHTS,
             job_count=1,
         )
         self.assertEqual(TYPING_EXTENSION_4_8_0__LICENSES, result)
-        self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, str(stdout))
+        self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, stdout.getvalue())
 
     def test_download_url(self) -> None:
         with self.record_stdout() as stdout:
@@ -808,11 +801,11 @@ License classifiers: Python Software Foundation License
                 )
         run_mock.assert_called_once_with(
             download_url="https://example.org/archive.tar.gz",
-            retrieval_flags=1,
+            retrieval_flags=RetrievalFlags.COPYRIGHTS,
             job_count=1,
         )
         self.assertEqual(TYPING_EXTENSION_4_8_0__LICENSES, result)
-        self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, str(stdout))
+        self.assertEqual(TYPING_EXTENSION_4_8_0__EXPECTED_OUTPUT, stdout.getvalue())
 
     def test_file_path(self) -> None:
         with self.record_stdout() as stdout:
@@ -829,30 +822,14 @@ License classifiers: Python Software Foundation License
 
 Apache-2.0 AND (LicenseRef-scancode-unknown-license-reference AND Apache-2.0)  1
 """,  # noqa: W291
-            str(stdout),
+            stdout.getvalue(),
         )
 
     def test_nested_archive(self) -> None:
         # url = "https://download.opensuse.org/source/distribution/leap/15.6/repo/oss/src/libaio-0.3.109-1.25.src.rpm"  # Takes too long.
-        with TemporaryDirectory() as archive_directory, NamedTemporaryFile(suffix=".tar.gz") as archive_file:
-            archive_directory_path = Path(archive_directory)
-            archive_directory_path.joinpath("directory1", "directory2").mkdir(parents=True)
-            archive_directory_path.joinpath("directory1", "directory2", "file.txt").write_text("MIT-0")
-            archive_directory_path.joinpath("directory1", "directory2", "file2.txt").write_text("Apache-2.0")
-            with TemporaryDirectory() as nested_directory:
-                nested_path = Path(nested_directory)
-                nested_path.joinpath("subdirectory").mkdir()
-                nested_path.joinpath("subdirectory", "README").write_text("CC-BY-2.0")
-                nested_path.joinpath("LICENSE").write_text("This is my license.")
-                with tarfile.open(archive_directory_path / "nested.tar.bz2", "w:bz2") as tar:
-                    tar.add(nested_path, arcname=nested_path.name)
-
-            archive_path = Path(archive_file.name)
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(archive_directory_path, arcname=archive_directory_path.name)
-
-            with self.record_stdout() as stdout:
-                result = retrieval.run(archive_path=archive_path, job_count=1)
+        archive_directory_path, nested_path = self.archive_directory_path, self.nested_path
+        with self.record_stdout() as stdout:
+            result = retrieval.run(archive_path=self.nested_archive_path, job_count=1)
 
         self.assertIsInstance(result, list)
         self.assertEqual(5, len(result), result)
@@ -869,5 +846,5 @@ Apache-2.0 AND (LicenseRef-scancode-unknown-license-reference AND Apache-2.0)  1
                                                              CC-BY-2.0  1
                                                                   None  3
 """,  # noqa: E501, W291
-            str(stdout),
+            stdout.getvalue(),
         )
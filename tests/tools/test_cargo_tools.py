@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import re
+import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock, TestCase
@@ -12,7 +13,7 @@ from unittest import mock, TestCase
 from license_tools.tools import cargo_tools
 from license_tools.tools.cargo_tools import PackageVersion
 from license_tools.utils.download_utils import Download
-from tests import get_from_url
+from tests import get_from_url_readonly, prime_cache
 from tests.data import BASE64__0_22_0__CARGO_TOML, CRYPTOGRAPHY__42_0_0__CARGO_LOCK
 
 
@@ -33,9 +34,13 @@ EXPECTED_METADATA = {
 }
 
 
+def setUpModule() -> None:
+    prime_cache([BASE64__0_22_0__CARGO_TOML, CRYPTOGRAPHY__42_0_0__CARGO_LOCK])
+
+
 class ReadTomlTestCase(TestCase):
     def test_read_toml(self) -> None:
-        with get_from_url(BASE64__0_22_0__CARGO_TOML) as path:
+        with get_from_url_readonly(BASE64__0_22_0__CARGO_TOML) as path:
             result = cargo_tools.read_toml(path)
         self.assertEqual(
             {
@@ -61,24 +66,21 @@ class ReadTomlTestCase(TestCase):
 
 class AnalyzeMetadataTestCase(TestCase):
     def test_path_is_cargo_toml(self) -> None:
-        with get_from_url(BASE64__0_22_0__CARGO_TOML) as path, TemporaryDirectory() as directory:
-            cargo_toml = Path(directory) / "Cargo.toml"
-            cargo_toml.write_bytes(path.read_bytes())
+        # The read-only copy already is a `Cargo.toml` file inside its own directory.
+        with get_from_url_readonly(BASE64__0_22_0__CARGO_TOML) as cargo_toml:
             metadata = cargo_tools.analyze_metadata(cargo_toml)
         self.assertEqual(EXPECTED_METADATA, metadata)
 
     def test_path_is_parent_of_cargo_toml(self) -> None:
-        with get_from_url(BASE64__0_22_0__CARGO_TOML) as path, TemporaryDirectory() as directory:
-            cargo_toml = Path(directory) / "Cargo.toml"
-            cargo_toml.write_bytes(path.read_bytes())
-            metadata = cargo_tools.analyze_metadata(Path(directory))
+        with get_from_url_readonly(BASE64__0_22_0__CARGO_TOML) as cargo_toml:
+            metadata = cargo_tools.analyze_metadata(cargo_toml.parent)
         self.assertEqual(EXPECTED_METADATA, metadata)
 
     def test_path_is_grandparent_of_cargo_toml(self) -> None:
-        with get_from_url(BASE64__0_22_0__CARGO_TOML) as path, TemporaryDirectory() as directory:
+        with get_from_url_readonly(BASE64__0_22_0__CARGO_TOML) as path, TemporaryDirectory() as directory:
             cargo_toml = Path(directory) / "base64-0.22.1" / "Cargo.toml"
             cargo_toml.parent.mkdir()
-            cargo_toml.write_bytes(path.read_bytes())
+            shutil.copyfile(path, cargo_toml)
             metadata = cargo_tools.analyze_metadata(Path(directory))
             self.assertEqual(EXPECTED_METADATA, metadata)
 
@@ -89,9 +91,7 @@ class AnalyzeMetadataTestCase(TestCase):
 
 class CheckMetadataTestCase(TestCase):
     def test_check_metadata(self) -> None:
-        with get_from_url(BASE64__0_22_0__CARGO_TOML) as path, TemporaryDirectory() as directory:
-            cargo_toml = Path(directory) / "Cargo.toml"
-            cargo_toml.write_bytes(path.read_bytes())
+        with get_from_url_readonly(BASE64__0_22_0__CARGO_TOML) as cargo_toml:
             metadata = cargo_tools.check_metadata(cargo_toml)
         self.assertEqual(
             """
@@ -133,7 +133,7 @@ class PackageVersionTestCase(TestCase):
 
 class GetPackageVersionsTestCase(TestCase):
     def test_get_package_versions(self) -> None:
-        with get_from_url(CRYPTOGRAPHY__42_0_0__CARGO_LOCK) as path:
+        with get_from_url_readonly(CRYPTOGRAPHY__42_0_0__CARGO_LOCK) as path:
             with mock.patch.object(cargo_tools.logger, "warning") as warning_mock:
                 package_versions = list(cargo_tools.get_package_versions(path))
         self.assertEqual(
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import datetime
+import os
 from collections import OrderedDict
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -14,31 +15,248 @@ from license_tools.tools import font_tools
 from tests import get_file
 
 
-class ConvertHeadFlagsTestCase(TestCase):
-    def test_none(self) -> None:
-        self.assertEqual("%", font_tools.convert_head_flags(0))
-
-    def test_all(self) -> None:
-        self.assertEqual(
+EXPECTED_TTF_RESULT = {
+    "head": OrderedDict(
+        [
+            ("Font Table Version", 1.0),
+            ("Font Revision", 1.10400390625),
+            ("Checksum", 1913909807),
+            ("Magic number", 1594834165),
             (
-                "Baseline for font at y=0; "
-                "Left sidebearing point at x=0; "
-                "Instructions may depend on point size; "
-                "Force ppem to integer values; "
-                "Instructions may alter advance width; "
-                "Lossless font data; "
-                "Font converted; "
-                "Font optimized for ClearType; "
-                "Last Resort font"
+                "Flags",
+                "Baseline for font at y=0; Left sidebearing point at x=0; Force ppem to integer values; Instructions may alter advance width",
             ),
-            font_tools.convert_head_flags(2 ** 16 - 1),
-        )
+            ("Units per em", 2048),
+            ("Created", "2009-07-07 22:19:06"),
+            ("Modified", "2023-02-28 11:34:38"),
+            ("xMin", -1002),
+            ("yMin", -529),
+            ("xMax", 2351),
+            ("yMax", 2078),
+            ("Mac Style", "%"),
+            ("Smallest readable size in pixels", 6),
+            (
+                "Font direction hint",
+                "Strongly left to right, but also contains neutrals",
+            ),
+            ("Index to Loc format", "Long offsets (Offset32)"),
+            ("Glyph Data Format", 0),
+        ]
+    ),
+    "name": OrderedDict(
+        [
+            (
+                "Copyright notice",
+                "Copyright 2013 The Carlito Project Authors (https://github.com/googlefonts/carlito)",
+            ),
+            ("Font family name", "Carlito"),
+            ("Font subfamily name", "Regular"),
+            ("Unique font identifier", "1.104;tyPL;Carlito-Regular"),
+            ("Full font name", "Carlito Regular"),
+            ("Version string", "Version 1.104"),
+            ("PostScript name", "Carlito-Regular"),
+            (
+                "Trademark",
+                "Carlito is a trademark of tyPoland Lukasz Dziedzic.",
+            ),
+            ("Manufacturer", "tyPoland Lukasz Dziedzic"),
+            ("Designer", "Lukasz Dziedzic"),
+            (
+                "Description",
+                "Carlito is a sanserif typeface family based on Lato.",
+            ),
+            ("URL Vendor", "http://www.lukaszdziedzic.eu"),
+            ("URL Designer", "http://www.lukaszdziedzic.eu"),
+            (
+                "License Description",
+                (
+                    "This Font Software is licensed under the SIL Open Font License, Version 1.1. "
+                    "This license is available with a FAQ at: https://scripts.sil.org/OFL"
+                ),
+            ),
+            ("License Info URL", "https://scripts.sil.org/OFL"),
+        ]
+    ),
+}
+
+
+EXPECTED_WOFF_RESULT = {
+    "head": OrderedDict(
+        [
+            ("Font Table Version", 1.0),
+            ("Font Revision", 1.0999908447265625),
+            ("Checksum", 339860824),
+            ("Magic number", 1594834165),
+            (
+                "Flags",
+                (
+                    "Baseline for font at y=0; Left sidebearing point at x=0; Instructions may depend on point size; "
+                    "Force ppem to integer values; Instructions may alter advance width"
+                ),
+            ),
+            ("Units per em", 2048),
+            ("Created", "2015-08-18 21:25:12"),
+            ("Modified", "2015-08-18 21:25:12"),
+            ("xMin", -10),
+            ("yMin", -678),
+            ("xMax", 3133),
+            ("yMax", 2245),
+            ("Mac Style", "%"),
+            ("Smallest readable size in pixels", 8),
+            (
+                "Font direction hint",
+                "Strongly left to right, but also contains neutrals",
+            ),
+            ("Index to Loc format", "Short offsets (Offset16)"),
+            ("Glyph Data Format", 0),
+        ]
+    ),
+    "name": OrderedDict(
+        [
+            (
+                "Copyright notice",
+                "Weather Icons licensed under SIL OFL 1.1 — Code licensed under MIT License — Documentation licensed under CC BY 3.0",
+            ),
+            ("Font family name", "Weather Icons"),
+            ("Font subfamily name", "Regular"),
+            ("Unique font identifier", "1.100;UKWN;WeatherIcons-Regular"),
+            ("Full font name", "Weather Icons Regular"),
+            (
+                "Version string",
+                "Version 1.100;PS 001.100;hotconv 1.0.70;makeotf.lib2.5.58329",
+            ),
+            ("PostScript name", "WeatherIcons-Regular"),
+            ("Designer", "Erik Flowers, Lukas Bischoff (v1 Art)"),
+            (
+                "URL Designer",
+                "http://www.helloerik.com, http://www.artill.de",
+            ),
+        ]
+    ),
+}
+
+
+EXPECTED_WOFF2_RESULT = {
+    "head": OrderedDict(
+        [
+            ("Font Table Version", 1.0),
+            ("Font Revision", 773.01171875),
+            ("Checksum", 1882611267),
+            ("Magic number", 1594834165),
+            (
+                "Flags",
+                "Baseline for font at y=0; Left sidebearing point at x=0; Force ppem to integer values",
+            ),
+            ("Units per em", 512),
+            ("Created", "2023-11-29 22:28:05"),
+            ("Modified", "2023-11-29 22:28:05"),
+            ("xMin", -13),
+            ("yMin", -75),
+            ("xMax", 651),
+            ("yMax", 459),
+            ("Mac Style", "%"),
+            ("Smallest readable size in pixels", 8),
+            (
+                "Font direction hint",
+                "Strongly left to right, but also contains neutrals",
+            ),
+            ("Index to Loc format", "Long offsets (Offset32)"),
+            ("Glyph Data Format", 0),
+        ]
+    ),
+    "name": OrderedDict(
+        [
+            ("Copyright notice", "Copyright (c) Font Awesome"),
+            ("Font family name", "Font Awesome 6 Free Solid"),
+            ("Font subfamily name", "Solid"),
+            ("Unique font identifier", "Font Awesome 6 Free Solid-6.5.1"),
+            ("Full font name", "Font Awesome 6 Free Solid"),
+            (
+                "Version string",
+                "Version 773.01171875 (Font Awesome version: 6.5.1)",
+            ),
+            ("PostScript name", "FontAwesome6Free-Solid"),
+            ("Description", "The web's most popular icon set and toolkit."),
+            ("URL Vendor", "https://fontawesome.com"),
+            ("Typographic Family name", "Font Awesome 6 Free"),
+            ("Typographic Subfamily name", "Solid"),
+        ]
+    ),
+}
+
+
+EXPECTED_OTF_RESULT = {
+    "head": OrderedDict(
+        [
+            ("Font Table Version", 1.0),
+            ("Font Revision", 773.01171875),
+            ("Checksum", 1579975067),
+            ("Magic number", 1594834165),
+            (
+                "Flags",
+                "Baseline for font at y=0; Left sidebearing point at x=0; Force ppem to integer values",
+            ),
+            ("Units per em", 512),
+            ("Created", "2023-11-29 22:27:59"),
+            ("Modified", "2023-11-29 22:27:59"),
+            ("xMin", 0),
+            ("yMin", -64),
+            ("xMax", 640),
+            ("yMax", 448),
+            ("Mac Style", "%"),
+            ("Smallest readable size in pixels", 8),
+            (
+                "Font direction hint",
+                "Strongly left to right, but also contains neutrals",
+            ),
+            ("Index to Loc format", "Short offsets (Offset16)"),
+            ("Glyph Data Format", 0),
+        ]
+    ),
+    "name": OrderedDict(
+        [
+            ("Copyright notice", "Copyright (c) Font Awesome"),
+            ("Font family name", "Font Awesome 6 Free Regular"),
+            ("Font subfamily name", "Regular"),
+            ("Unique font identifier", "Font Awesome 6 Free Regular-6.5.1"),
+            ("Full font name", "Font Awesome 6 Free Regular"),
+            (
+                "Version string",
+                "Version 773.01171875 (Font Awesome version: 6.5.1)",
+            ),
+            ("PostScript name", "FontAwesome6Free-Regular"),
+            ("Description", "The web's most popular icon set and toolkit."),
+            ("URL Vendor", "https://fontawesome.com"),
+            ("Typographic Family name", "Font Awesome 6 Free"),
+            ("Typographic Subfamily name", "Regular"),
+        ]
+    ),
+}
 
-    def test_some(self) -> None:
-        self.assertEqual(
-            "Baseline for font at y=0; " "Font converted",
-            font_tools.convert_head_flags(1 + 2 ** 12),
-        )
+
+class ConvertHeadFlagsTestCase(TestCase):
+    def test_convert_head_flags(self) -> None:
+        cases = [
+            (0, "%"),
+            (
+                2 ** 16 - 1,
+                (
+                    "Baseline for font at y=0; "
+                    "Left sidebearing point at x=0; "
+                    "Instructions may depend on point size; "
+                    "Force ppem to integer values; "
+                    "Instructions may alter advance width; "
+                    "Lossless font data; "
+                    "Font converted; "
+                    "Font optimized for ClearType; "
+                    "Last Resort font"
+                ),
+            ),
+            (1 + 2 ** 12, "Baseline for font at y=0; " "Font converted"),
+        ]
+        for flags, expected in cases:
+            with self.subTest(flags=flags):
+                self.assertEqual(expected, font_tools.convert_head_flags(flags))
 
 
 class ConvertTimestamp(TestCase):
@@ -64,19 +282,15 @@ class ConvertTimestamp(TestCase):
 
 
 class ConvertMacStyleTestCase(TestCase):
-    def test_none(self) -> None:
-        self.assertEqual("%", font_tools.convert_mac_style(0))
-
-    def test_all(self) -> None:
-        self.assertEqual(
-            "Bold, Italic, Underline, Outline, Shadow, Condensed, Extended",
-            font_tools.convert_mac_style(2 ** 7 - 1),
-        )
-
-    def test_some(self) -> None:
-        self.assertEqual(
-            "Bold, Italic, Condensed", font_tools.convert_mac_style(1 + 2 + 32)
-        )
+    def test_convert_mac_style(self) -> None:
+        cases = [
+            (0, "%"),
+            (2 ** 7 - 1, "Bold, Italic, Underline, Outline, Shadow, Condensed, Extended"),
+            (1 + 2 + 32, "Bold, Italic, Condensed"),
+        ]
+        for flags, expected in cases:
+            with self.subTest(flags=flags):
+                self.assertEqual(expected, font_tools.convert_mac_style(flags))
 
 
 class ConvertFontDirectionHintTestCase(TestCase):
@@ -115,244 +329,25 @@ class AnalyzeFontTestCase(TestCase):
         with get_file("Carlito-Regular.ttf") as path:
             result = font_tools.analyze_font(path)
 
-        self.assertEqual(
-            {
-                "head": OrderedDict(
-                    [
-                        ("Font Table Version", 1.0),
-                        ("Font Revision", 1.10400390625),
-                        ("Checksum", 1913909807),
-                        ("Magic number", 1594834165),
-                        (
-                            "Flags",
-                            "Baseline for font at y=0; Left sidebearing point at x=0; Force ppem to integer values; Instructions may alter advance width",
-                        ),
-                        ("Units per em", 2048),
-                        ("Created", "2009-07-07 22:19:06"),
-                        ("Modified", "2023-02-28 11:34:38"),
-                        ("xMin", -1002),
-                        ("yMin", -529),
-                        ("xMax", 2351),
-                        ("yMax", 2078),
-                        ("Mac Style", "%"),
-                        ("Smallest readable size in pixels", 6),
-                        (
-                            "Font direction hint",
-                            "Strongly left to right, but also contains neutrals",
-                        ),
-                        ("Index to Loc format", "Long offsets (Offset32)"),
-                        ("Glyph Data Format", 0),
-                    ]
-                ),
-                "name": OrderedDict(
-                    [
-                        (
-                            "Copyright notice",
-                            "Copyright 2013 The Carlito Project Authors (https://github.com/googlefonts/carlito)",
-                        ),
-                        ("Font family name", "Carlito"),
-                        ("Font subfamily name", "Regular"),
-                        ("Unique font identifier", "1.104;tyPL;Carlito-Regular"),
-                        ("Full font name", "Carlito Regular"),
-                        ("Version string", "Version 1.104"),
-                        ("PostScript name", "Carlito-Regular"),
-                        (
-                            "Trademark",
-                            "Carlito is a trademark of tyPoland Lukasz Dziedzic.",
-                        ),
-                        ("Manufacturer", "tyPoland Lukasz Dziedzic"),
-                        ("Designer", "Lukasz Dziedzic"),
-                        (
-                            "Description",
-                            "Carlito is a sanserif typeface family based on Lato.",
-                        ),
-                        ("URL Vendor", "http://www.lukaszdziedzic.eu"),
-                        ("URL Designer", "http://www.lukaszdziedzic.eu"),
-                        (
-                            "License Description",
-                            (
-                                "This Font Software is licensed under the SIL Open Font License, Version 1.1. "
-                                "This license is available with a FAQ at: https://scripts.sil.org/OFL"
-                            ),
-                        ),
-                        ("License Info URL", "https://scripts.sil.org/OFL"),
-                    ]
-                ),
-            },
-            result,
-        )
+        self.assertEqual(EXPECTED_TTF_RESULT, result)
 
     def test_woff_file(self) -> None:
         with get_file("weathericons-regular-webfont.woff") as path:
             result = font_tools.analyze_font(path)
 
-        self.assertEqual(
-            {
-                "head": OrderedDict(
-                    [
-                        ("Font Table Version", 1.0),
-                        ("Font Revision", 1.0999908447265625),
-                        ("Checksum", 339860824),
-                        ("Magic number", 1594834165),
-                        (
-                            "Flags",
-                            (
-                                "Baseline for font at y=0; Left sidebearing point at x=0; Instructions may depend on point size; "
-                                "Force ppem to integer values; Instructions may alter advance width"
-                            ),
-                        ),
-                        ("Units per em", 2048),
-                        ("Created", "2015-08-18 21:25:12"),
-                        ("Modified", "2015-08-18 21:25:12"),
-                        ("xMin", -10),
-                        ("yMin", -678),
-                        ("xMax", 3133),
-                        ("yMax", 2245),
-                        ("Mac Style", "%"),
-                        ("Smallest readable size in pixels", 8),
-                        (
-                            "Font direction hint",
-                            "Strongly left to right, but also contains neutrals",
-                        ),
-                        ("Index to Loc format", "Short offsets (Offset16)"),
-                        ("Glyph Data Format", 0),
-                    ]
-                ),
-                "name": OrderedDict(
-                    [
-                        (
-                            "Copyright notice",
-                            "Weather Icons licensed under SIL OFL 1.1 — Code licensed under MIT License — Documentation licensed under CC BY 3.0",
-                        ),
-                        ("Font family name", "Weather Icons"),
-                        ("Font subfamily name", "Regular"),
-                        ("Unique font identifier", "1.100;UKWN;WeatherIcons-Regular"),
-                        ("Full font name", "Weather Icons Regular"),
-                        (
-                            "Version string",
-                            "Version 1.100;PS 001.100;hotconv 1.0.70;makeotf.lib2.5.58329",
-                        ),
-                        ("PostScript name", "WeatherIcons-Regular"),
-                        ("Designer", "Erik Flowers, Lukas Bischoff (v1 Art)"),
-                        (
-                            "URL Designer",
-                            "http://www.helloerik.com, http://www.artill.de",
-                        ),
-                    ]
-                ),
-            },
-            result,
-        )
+        self.assertEqual(EXPECTED_WOFF_RESULT, result)
 
     def test_woff2_file(self) -> None:
         with get_file("fa-solid-900.woff2") as path:
             result = font_tools.analyze_font(path)
 
-        self.assertEqual(
-            {
-                "head": OrderedDict(
-                    [
-                        ("Font Table Version", 1.0),
-                        ("Font Revision", 773.01171875),
-                        ("Checksum", 1882611267),
-                        ("Magic number", 1594834165),
-                        (
-                            "Flags",
-                            "Baseline for font at y=0; Left sidebearing point at x=0; Force ppem to integer values",
-                        ),
-                        ("Units per em", 512),
-                        ("Created", "2023-11-29 22:28:05"),
-                        ("Modified", "2023-11-29 22:28:05"),
-                        ("xMin", -13),
-                        ("yMin", -75),
-                        ("xMax", 651),
-                        ("yMax", 459),
-                        ("Mac Style", "%"),
-                        ("Smallest readable size in pixels", 8),
-                        (
-                            "Font direction hint",
-                            "Strongly left to right, but also contains neutrals",
-                        ),
-                        ("Index to Loc format", "Long offsets (Offset32)"),
-                        ("Glyph Data Format", 0),
-                    ]
-                ),
-                "name": OrderedDict(
-                    [
-                        ("Copyright notice", "Copyright (c) Font Awesome"),
-                        ("Font family name", "Font Awesome 6 Free Solid"),
-                        ("Font subfamily name", "Solid"),
-                        ("Unique font identifier", "Font Awesome 6 Free Solid-6.5.1"),
-                        ("Full font name", "Font Awesome 6 Free Solid"),
-                        (
-                            "Version string",
-                            "Version 773.01171875 (Font Awesome version: 6.5.1)",
-                        ),
-                        ("PostScript name", "FontAwesome6Free-Solid"),
-                        ("Description", "The web's most popular icon set and toolkit."),
-                        ("URL Vendor", "https://fontawesome.com"),
-                        ("Typographic Family name", "Font Awesome 6 Free"),
-                        ("Typographic Subfamily name", "Solid"),
-                    ]
-                ),
-            },
-            result,
-        )
+        self.assertEqual(EXPECTED_WOFF2_RESULT, result)
 
     def test_otf_file(self) -> None:
         with get_file("Font Awesome 6 Free-Regular-400.otf") as path:
             result = font_tools.analyze_font(path)
 
-        self.assertEqual(
-            {
-                "head": OrderedDict(
-                    [
-                        ("Font Table Version", 1.0),
-                        ("Font Revision", 773.01171875),
-                        ("Checksum", 1579975067),
-                        ("Magic number", 1594834165),
-                        (
-                            "Flags",
-                            "Baseline for font at y=0; Left sidebearing point at x=0; Force ppem to integer values",
-                        ),
-                        ("Units per em", 512),
-                        ("Created", "2023-11-29 22:27:59"),
-                        ("Modified", "2023-11-29 22:27:59"),
-                        ("xMin", 0),
-                        ("yMin", -64),
-                        ("xMax", 640),
-                        ("yMax", 448),
-                        ("Mac Style", "%"),
-                        ("Smallest readable size in pixels", 8),
-                        (
-                            "Font direction hint",
-                            "Strongly left to right, but also contains neutrals",
-                        ),
-                        ("Index to Loc format", "Short offsets (Offset16)"),
-                        ("Glyph Data Format", 0),
-                    ]
-                ),
-                "name": OrderedDict(
-                    [
-                        ("Copyright notice", "Copyright (c) Font Awesome"),
-                        ("Font family name", "Font Awesome 6 Free Regular"),
-                        ("Font subfamily name", "Regular"),
-                        ("Unique font identifier", "Font Awesome 6 Free Regular-6.5.1"),
-                        ("Full font name", "Font Awesome 6 Free Regular"),
-                        (
-                            "Version string",
-                            "Version 773.01171875 (Font Awesome version: 6.5.1)",
-                        ),
-                        ("PostScript name", "FontAwesome6Free-Regular"),
-                        ("Description", "The web's most popular icon set and toolkit."),
-                        ("URL Vendor", "https://fontawesome.com"),
-                        ("Typographic Family name", "Font Awesome 6 Free"),
-                        ("Typographic Subfamily name", "Regular"),
-                    ]
-                ),
-            },
-            result,
-        )
+        self.assertEqual(EXPECTED_OTF_RESULT, result)
 
 
 class CheckFontTestCase(TestCase):
@@ -400,7 +395,8 @@ Typographic Subfamily name: Solid"""[1:],
 class DumpToTtxTestCase(TestCase):
     def test_dump_to_ttx(self) -> None:
         with get_file("Carlito-Regular.ttf") as path:
-            with NamedTemporaryFile(suffix=".ttx") as target:
+            # Avoid writing the large dump to disk if a memory-backed file system is available.
+            with NamedTemporaryFile(suffix=".ttx", dir="/dev/shm" if os.path.isdir("/dev/shm") else None) as target:
                 target_path = Path(target.name)
                 result = font_tools.dump_to_ttx(
                     source_path=path, target_path=target_path
@@ -413,5 +409,4 @@ class DumpToTtxTestCase(TestCase):
                 # corresponding target files. A size comparison should be sufficient
                 # for now, as this mostly is some basic *fontTools* integration test
                 # anyway.
-                actual = target_path.read_text()
-                self.assertLessEqual(9627200, len(actual))  # Tests showed 9627208.
+                self.assertLessEqual(9627200, target_path.stat().st_size)  # Tests showed 9627208.
@@ -52,44 +52,36 @@ class GetElfTypeTestCase(TestCase):
 
 
 class CheckSharedObjectsTestCase(TestCase):
-    def test_so(self) -> None:
-        path = get_libc_path().resolve()
-        with mock.patch(
-            "subprocess.check_output", return_value=b"Test output\nAnother line\n"
-        ) as subprocess_mock:
-            result = check_shared_objects(path)
-        self.assertEqual("Test output\nAnother line\n", result)
-        subprocess_mock.assert_called_once_with(["ldd", path], stderr=subprocess.PIPE)
-
-    def test_binary(self) -> None:
-        path = Path("/usr/bin/bc")
-        with mock.patch(
-            "subprocess.check_output", return_value=b"Test output\nAnother line\n"
-        ) as subprocess_mock:
-            result = check_shared_objects(path)
-        self.assertEqual("Test output\nAnother line\n", result)
-        subprocess_mock.assert_called_once_with(["ldd", path], stderr=subprocess.PIPE)
+    def test_check_shared_objects(self) -> None:
+        # Determine the real library path before mocking the `ldd` calls.
+        cases = [
+            (get_libc_path().resolve(), True),
+            (Path("/usr/bin/bc"), True),
+            (Path("/tmp/libdummy.py"), False),
+        ]
+        with mock.patch("subprocess.check_output", return_value=b"Test output\nAnother line\n") as subprocess_mock:
+            for path, is_checked in cases:
+                with self.subTest(path=path):
+                    subprocess_mock.reset_mock()
+                    result = check_shared_objects(path)
+                    if is_checked:
+                        self.assertEqual("Test output\nAnother line\n", result)
+                        subprocess_mock.assert_called_once_with(["ldd", path], stderr=subprocess.PIPE)
+                    else:
+                        self.assertIsNone(result)
+                        subprocess_mock.assert_not_called()
 
-    def test_python(self) -> None:
-        path = Path("/tmp/libdummy.py")
-        with mock.patch(
+    def test_symlink(self) -> None:
+        with TemporaryDirectory() as tempdir, mock.patch(
             "subprocess.check_output", return_value=b"Test output\nAnother line\n"
         ) as subprocess_mock:
-            result = check_shared_objects(path)
-        self.assertIsNone(result)
-        subprocess_mock.assert_not_called()
-
-    def test_symlink(self) -> None:
-        with TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             target = directory.joinpath("libdummy.so.42.0.0")
             target.write_bytes(b"abc")
             source = directory.joinpath("libdummy.so")
             source.symlink_to(target=target)
 
-            with mock.patch(
-                "subprocess.check_output", return_value=b"Test output\nAnother line\n"
-            ) as subprocess_mock, mock.patch.object(
+            with mock.patch.object(
                 linking_tools.logger, "warning"
             ) as warning_mock, mock.patch.object(
                 linking_tools, "is_elf", return_value=True
@@ -102,9 +94,7 @@ class CheckSharedObjectsTestCase(TestCase):
             )
             elf_mock.assert_called_once_with(source)
 
-            with mock.patch(
-                "subprocess.check_output", return_value=b"Test output\nAnother line\n"
-            ) as subprocess_mock, mock.patch.object(
+            with mock.patch.object(
                 linking_tools, "is_elf", return_value=True
             ) as elf_mock:
                 result = check_shared_objects(source.resolve())
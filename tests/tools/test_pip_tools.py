@@ -17,13 +17,17 @@ from unittest import mock, TestCase
 from license_tools.tools import pip_tools
 from license_tools.utils import archive_utils
 from license_tools.utils.path_utils import get_files_from_directory
-from tests import get_from_url
+from tests import get_from_url_readonly, prime_cache
 from tests.data import JWCRYPTO__1_5_4__TAR_GZ, PYPDF__3_17_4__WHEEL
 
 
+def setUpModule() -> None:
+    prime_cache([JWCRYPTO__1_5_4__TAR_GZ, PYPDF__3_17_4__WHEEL])
+
+
 class AnalyzeMetadataTestCase(TestCase):
     def test_valid(self) -> None:
-        with get_from_url(PYPDF__3_17_4__WHEEL) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(PYPDF__3_17_4__WHEEL) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             archive_utils.extract(
                 archive_path=path, target_directory=directory
@@ -45,7 +49,7 @@ class AnalyzeMetadataTestCase(TestCase):
 
 class CheckMetadataTestCase(TestCase):
     def test_check_metadata__dist_info(self) -> None:
-        with get_from_url(PYPDF__3_17_4__WHEEL) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(PYPDF__3_17_4__WHEEL) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             archive_utils.extract(
                 archive_path=path, target_directory=directory
@@ -85,7 +89,7 @@ License classifiers: BSD License
 """[1:-1], result)
 
     def test_check_metadata__egg_info(self) -> None:
-        with get_from_url(JWCRYPTO__1_5_4__TAR_GZ) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(JWCRYPTO__1_5_4__TAR_GZ) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             archive_utils.extract(
                 archive_path=path, target_directory=directory
@@ -206,7 +210,8 @@ class DownloadPackageTestCase(TestCase):
                             "--dest",
                             directories[0],
                         ],
-                        capture_output=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
                         text=True,
                         check=True,
                     ),
@@ -223,7 +228,8 @@ class DownloadPackageTestCase(TestCase):
                             "--index-url",
                             "DUMMY",
                         ],
-                        capture_output=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
                         text=True,
                         check=True,
                     ),
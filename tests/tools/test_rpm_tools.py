@@ -5,19 +5,24 @@
 from __future__ import annotations
 
 import sys
+from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest import TestCase
+from unittest import mock, TestCase
 
 from license_tools.tools import rpm_tools
 from license_tools.utils.path_utils import get_files_from_directory
-from tests import get_from_url
+from tests import get_from_url_readonly, prime_cache
 from tests.data import LIBAIO1__0_3_109_1_25__RPM, LIBAIO1__0_3_109_1_25__SRC_RPM
 
 
+def setUpModule() -> None:
+    prime_cache([LIBAIO1__0_3_109_1_25__RPM, LIBAIO1__0_3_109_1_25__SRC_RPM])
+
+
 class ExtractTestCase(TestCase):
     def test_unpack_rpm_file(self) -> None:
-        with get_from_url(LIBAIO1__0_3_109_1_25__RPM) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(LIBAIO1__0_3_109_1_25__RPM) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             rpm_tools.extract(
                 archive_path=path, target_path=directory
@@ -33,6 +38,20 @@ class ExtractTestCase(TestCase):
                 actual,
             )
 
+    def test_path_traversal(self) -> None:
+        for name in ["../target2/evil.txt", "usr/..", "../../evil.txt"]:
+            with self.subTest(name=name), TemporaryDirectory() as tempdir:
+                directory = Path(tempdir, "target")
+                directory.mkdir()
+                rpm_file = mock.MagicMock()
+                rpm_file.__enter__.return_value.getmembers.return_value = [mock.Mock()]
+                rpm_file.__enter__.return_value.getmembers.return_value[0].name = name
+                rpm_file.__enter__.return_value.extractfile.return_value = BytesIO(b"Hello World!\n")
+                with mock.patch("rpmfile.open", return_value=rpm_file):
+                    with self.assertRaisesRegex(expected_exception=ValueError, expected_regex=r"^Attempted path traversal: "):
+                        rpm_tools.extract(archive_path=Path("/dummy.rpm"), target_path=directory)
+                self.assertEqual([], list(get_files_from_directory(tempdir)))
+
 
 class FileModesTestCase(TestCase):
     def test_make_verbose(self) -> None:
@@ -112,7 +131,7 @@ class CheckRpmHeadersTestCase(TestCase):
             file_verification_flags = "[<VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags: 0>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>]"  # noqa: E501
             required_names_flags = "[<DependencyFlags.INTERP|SCRIPT_POST: 1280>, <DependencyFlags.INTERP|SCRIPT_POSTUN: 4352>, <DependencyFlags.FIND_REQUIRES: 16384>, <DependencyFlags.FIND_REQUIRES: 16384>, <DependencyFlags.LESS|EQUAL|RPMLIB: 16777226>, <DependencyFlags.LESS|EQUAL|RPMLIB: 16777226>, <DependencyFlags.LESS|EQUAL|RPMLIB: 16777226>, <DependencyFlags.LESS|EQUAL|RPMLIB: 16777226>]"  # noqa: E501
 
-        with get_from_url(LIBAIO1__0_3_109_1_25__RPM) as rpm_path:
+        with get_from_url_readonly(LIBAIO1__0_3_109_1_25__RPM) as rpm_path:
             results = rpm_tools.check_rpm_headers(rpm_path)
         self.assertEqual(
             r"""
@@ -210,7 +229,7 @@ Index Into File Dependencies Dictionary Denoting Start Of File's Dependencies: [
             required_names_flags = "[<DependencyFlags.LESS|EQUAL|RPMLIB: 16777226>, <DependencyFlags.LESS|EQUAL|RPMLIB: 16777226>]"
             file_verification_flags = "[<VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>, <VerifyFlags.MD5|SIZE|LINK_TO|USER|GROUP|MTIME|MODE|RDEV|CAPS|4294966784: 4294967295>]"  # noqa: E501
 
-        with get_from_url(LIBAIO1__0_3_109_1_25__SRC_RPM) as rpm_path:
+        with get_from_url_readonly(LIBAIO1__0_3_109_1_25__SRC_RPM) as rpm_path:
             results = rpm_tools.check_rpm_headers(rpm_path)
         self.assertEqual(
             r"""
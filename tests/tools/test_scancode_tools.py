@@ -7,7 +7,7 @@ from __future__ import annotations
 import datetime
 from pathlib import Path
 from tempfile import mkdtemp, NamedTemporaryFile
-from typing import cast, Dict
+from typing import cast
 from unittest import TestCase
 
 from faker import Faker
@@ -25,7 +25,7 @@ from license_tools.tools.scancode_tools import (
     PackageResults, Party, Url,
     Urls,
 )
-from tests import get_from_url
+from tests import get_from_url_readonly
 from tests.data import LIBAIO1__0_3_109_1_25__RPM, LICENSE_PATH, SETUP_PATH, SETUP_PY_LICENSES
 
 
@@ -52,7 +52,7 @@ class FileResultsTestCase(TestCase):
                 method(getattr(result, field))
 
     def test_full(self) -> None:
-        flags = cast(Dict[str, bool], RetrievalFlags.all(as_kwargs=True))
+        flags = RetrievalFlags.all(as_kwargs=True)
         del flags["retrieve_ldd_data"]
         del flags["retrieve_font_data"]
         del flags["retrieve_python_metadata"]
@@ -243,7 +243,7 @@ class FileResultsTestCase(TestCase):
 
 class PackageResultsTestCase(TestCase):
     def test_rpm(self) -> None:
-        with get_from_url(LIBAIO1__0_3_109_1_25__RPM) as rpm_path:
+        with get_from_url_readonly(LIBAIO1__0_3_109_1_25__RPM) as rpm_path:
             results = PackageResults.from_rpm(rpm_path)
         self.assertEqual(
             PackageResults(
@@ -7,10 +7,14 @@ from __future__ import annotations
 from unittest import TestCase
 
 from license_tools.tools import translation_tools
-from tests import get_file, get_from_url
+from tests import get_file, get_from_url_readonly, prime_cache
 from tests.data import DJANGO__5076BB4__DJANGO_MO, DJANGO__5076BB4__DJANGO_PO, LICENSE_PATH, SETUP_PATH
 
 
+def setUpModule() -> None:
+    prime_cache([DJANGO__5076BB4__DJANGO_MO, DJANGO__5076BB4__DJANGO_PO])
+
+
 class IsCompiledGettextFileTestCase(TestCase):
     def test_is_compiled_gettext_file(self) -> None:
         self.assertFalse(translation_tools.is_compiled_gettext_file(SETUP_PATH))
@@ -22,10 +26,10 @@ class IsCompiledGettextFileTestCase(TestCase):
         with get_file("croissant.jpg") as path:
             self.assertFalse(translation_tools.is_compiled_gettext_file(path))
 
-        with get_from_url(DJANGO__5076BB4__DJANGO_MO) as path:
+        with get_from_url_readonly(DJANGO__5076BB4__DJANGO_MO) as path:
             self.assertTrue(translation_tools.is_compiled_gettext_file(path))
 
-        with get_from_url(DJANGO__5076BB4__DJANGO_PO) as path:
+        with get_from_url_readonly(DJANGO__5076BB4__DJANGO_PO) as path:
             self.assertFalse(translation_tools.is_compiled_gettext_file(path))
 
 
@@ -40,7 +44,7 @@ class CheckCompiledGettextMetadataTestCase(TestCase):
             self.assertIsNone(translation_tools.check_compiled_gettext_metadata(path))
 
     def test_django_mo(self) -> None:
-        with get_from_url(DJANGO__5076BB4__DJANGO_MO) as path:
+        with get_from_url_readonly(DJANGO__5076BB4__DJANGO_MO) as path:
             result = translation_tools.check_compiled_gettext_metadata(path)
 
         self.assertIsNotNone(result)
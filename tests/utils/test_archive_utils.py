@@ -4,23 +4,40 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import stat
+import tarfile
+import zipfile
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from unittest import TestCase
+from unittest import mock, TestCase
 
 from license_tools.utils import archive_utils
 from license_tools.utils.path_utils import get_files_from_directory
-from tests import get_from_url
+from tests import get_from_url_readonly, prime_cache
 from tests.data import (
     BASE64__0_22_0__CRATE, JSON__20231013__JAR, LIBAIO1__0_3_109_1_25__RPM, LIBAIO1__0_3_109_1_25__SRC_RPM, TYPING_EXTENSION_4_8_0__SOURCE_FILES,
     TYPING_EXTENSION_4_8_0__WHEEL_FILES, TYPING_EXTENSIONS__4_8_0__SDIST, TYPING_EXTENSIONS__4_8_0__WHEEL,
 )
 
 
+def setUpModule() -> None:
+    prime_cache(
+        [
+            BASE64__0_22_0__CRATE,
+            JSON__20231013__JAR,
+            LIBAIO1__0_3_109_1_25__RPM,
+            LIBAIO1__0_3_109_1_25__SRC_RPM,
+            TYPING_EXTENSIONS__4_8_0__SDIST,
+            TYPING_EXTENSIONS__4_8_0__WHEEL,
+        ]
+    )
+
+
 class ArchiveUtilsTestCase(TestCase):
     def test_jar(self) -> None:
-        with get_from_url(JSON__20231013__JAR) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(JSON__20231013__JAR) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             self.assertTrue(archive_utils.can_extract(path))
             archive_utils.extract(archive_path=path, target_directory=directory)
@@ -64,7 +81,7 @@ class ArchiveUtilsTestCase(TestCase):
             )
 
     def test_wheel(self) -> None:
-        with get_from_url(TYPING_EXTENSIONS__4_8_0__WHEEL) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(TYPING_EXTENSIONS__4_8_0__WHEEL) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             self.assertTrue(archive_utils.can_extract(path))
             archive_utils.extract(archive_path=path, target_directory=directory)
@@ -72,7 +89,7 @@ class ArchiveUtilsTestCase(TestCase):
             self.assertEqual(TYPING_EXTENSION_4_8_0__WHEEL_FILES, actual)
 
     def test_rpm_file(self) -> None:
-        with get_from_url(LIBAIO1__0_3_109_1_25__RPM) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(LIBAIO1__0_3_109_1_25__RPM) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             self.assertTrue(archive_utils.can_extract(path))
             archive_utils.extract(archive_path=path, target_directory=directory)
@@ -87,7 +104,7 @@ class ArchiveUtilsTestCase(TestCase):
             )
 
     def test_tar_gz(self) -> None:
-        with get_from_url(TYPING_EXTENSIONS__4_8_0__SDIST) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(TYPING_EXTENSIONS__4_8_0__SDIST) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             self.assertTrue(archive_utils.can_extract(path))
             archive_utils.extract(archive_path=path, target_directory=directory)
@@ -95,7 +112,7 @@ class ArchiveUtilsTestCase(TestCase):
             self.assertEqual(TYPING_EXTENSION_4_8_0__SOURCE_FILES, actual)
 
     def test_rust_crate(self) -> None:
-        with get_from_url(BASE64__0_22_0__CRATE) as path, TemporaryDirectory() as tempdir:
+        with get_from_url_readonly(BASE64__0_22_0__CRATE) as path, TemporaryDirectory() as tempdir:
             directory = Path(tempdir)
             self.assertTrue(archive_utils.can_extract(path))
             archive_utils.extract(archive_path=path, target_directory=directory)
@@ -176,11 +193,191 @@ class ArchiveUtilsTestCase(TestCase):
                 {x.name for x in directory.joinpath(source_path.name).glob("*")},
             )
 
+    def test_zip__large_member(self) -> None:
+        content = os.urandom(3 * 1024 * 1024 + 42)
+        with TemporaryDirectory() as tempdir, NamedTemporaryFile(suffix=".zip") as zip_file:
+            directory = Path(tempdir)
+            with zipfile.ZipFile(zip_file.name, mode="w") as archive:
+                archive.writestr("data/large.bin", content)
+                archive.writestr("data/small.txt", "abc")
+                for index in range(50):
+                    archive.writestr(f"data/files/file{index:02d}.txt", f"File {index}")
+
+            archive_utils.extract(archive_path=Path(zip_file.name), target_directory=directory)
+            self.assertEqual(content, directory.joinpath("data", "large.bin").read_bytes())
+            self.assertEqual("abc", directory.joinpath("data", "small.txt").read_text())
+            for index in range(50):
+                self.assertEqual(f"File {index}", directory.joinpath("data", "files", f"file{index:02d}.txt").read_text())
+
+    def test_zip__path_traversal(self) -> None:
+        with TemporaryDirectory() as tempdir, NamedTemporaryFile(suffix=".whl") as zip_file:
+            directory = Path(tempdir, "target")
+            directory.mkdir()
+            with zipfile.ZipFile(zip_file.name, mode="w") as archive:
+                archive.writestr("../evil.txt", "abc")
+                archive.writestr("/absolute/path.txt", "def")
+                archive.writestr("sub/../../other.txt", "ghi")
+                archive.writestr("../", "")
+                archive.writestr("regular.txt", "jkl")
+
+            # The offending members are sanitized, while the other members are extracted as usual.
+            archive_utils.extract(archive_path=Path(zip_file.name), target_directory=directory)
+            self.assertEqual(["target"], [x.name for x in Path(tempdir).iterdir()])
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual(["absolute/path.txt", "evil.txt", "regular.txt", "sub/other.txt"], actual)
+            self.assertEqual("abc", directory.joinpath("evil.txt").read_text())
+            self.assertEqual("def", directory.joinpath("absolute", "path.txt").read_text())
+
+    def test_zip__duplicate_members(self) -> None:
+        with TemporaryDirectory() as tempdir, NamedTemporaryFile(suffix=".zip") as zip_file:
+            directory = Path(tempdir)
+            with zipfile.ZipFile(zip_file.name, mode="w") as archive:
+                for content in ["1", "2", "3"]:
+                    archive.writestr("dup.txt", content)
+                archive.writestr("sub/archive.tar.gz", "a")
+                archive.writestr("sub/archive.tar.gz", "b")
+                archive.writestr("LICENSE", "a")
+                archive.writestr("LICENSE", "b")
+
+            archive_utils.extract(archive_path=Path(zip_file.name), target_directory=directory)
+            self.assertEqual(
+                {
+                    "LICENSE": "a",
+                    "LICENSE_1": "b",
+                    "dup.txt": "1",
+                    "dup_1.txt": "2",
+                    "dup_2.txt": "3",
+                    "sub/archive.tar.gz": "a",
+                    "sub/archive_1.tar.gz": "b",
+                },
+                {name: path.read_text() for path, name in get_files_from_directory(directory)},
+            )
+
+    def test_zip__broken_member(self) -> None:
+        with TemporaryDirectory() as tempdir, NamedTemporaryFile(suffix=".zip") as zip_file:
+            directory = Path(tempdir)
+            with zipfile.ZipFile(zip_file.name, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("good.txt", "Good content. " * 50)
+                archive.writestr("bad.txt", "Bad content. " * 200)
+                info = archive.getinfo("bad.txt")
+            # Corrupt the deflate stream of the second member.
+            data = bytearray(Path(zip_file.name).read_bytes())
+            offset = info.header_offset + 30 + len(info.filename.encode()) + len(info.extra) + 5
+            data[offset:offset + 10] = b"\xff" * 10
+            Path(zip_file.name).write_bytes(data)
+
+            with self.assertLogs(archive_utils.logger, level="WARNING") as logs:
+                archive_utils.extract(archive_path=Path(zip_file.name), target_directory=directory)
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual(["good.txt"], actual)
+            self.assertEqual("Good content. " * 50, directory.joinpath("good.txt").read_text())
+            self.assertEqual(1, len(logs.output), logs.output)
+            self.assertIn(f"Skipping broken member bad.txt of {zip_file.name}: ", logs.output[0])
+
+    def test_zip__symlink(self) -> None:
+        with TemporaryDirectory() as tempdir, NamedTemporaryFile(suffix=".zip") as zip_file:
+            directory = Path(tempdir)
+            with zipfile.ZipFile(zip_file.name, mode="w") as archive:
+                archive.writestr("file.txt", "abc")
+                info = zipfile.ZipInfo("link")
+                info.external_attr = (stat.S_IFLNK | 0o777) << 16
+                archive.writestr(info, "/etc/passwd")
+
+            archive_utils.extract(archive_path=Path(zip_file.name), target_directory=directory)
+            self.assertEqual(["file.txt"], [x.name for x in directory.iterdir()])
+
+    def test_zip__misleading_suffix(self) -> None:
+        with TemporaryDirectory() as tempdir, NamedTemporaryFile(suffix=".zip") as zip_file:
+            directory = Path(tempdir)
+            source_path = directory / "test.txt"
+            source_path.write_text("abc")
+            with tarfile.open(zip_file.name, mode="w:gz") as archive:
+                archive.add(source_path, arcname="test.txt")
+            source_path.unlink()
+
+            archive_utils.extract(archive_path=Path(zip_file.name), target_directory=directory)
+            self.assertEqual("abc", directory.joinpath("test.txt").read_text())
+
     def test_unknown(self) -> None:
         self.assertFalse(archive_utils.can_extract(Path("/home/bin/run.exe")))
 
+    def test_can_extract__magic_number(self) -> None:
+        with NamedTemporaryFile(suffix=".whl") as zip_file:
+            path = Path(zip_file.name)
+            with zipfile.ZipFile(path, mode="w") as archive:
+                archive.writestr("test.txt", "abc")
+            with mock.patch.object(archive_utils, "_should_extract") as should_extract_mock:
+                self.assertTrue(archive_utils.can_extract(path))
+            should_extract_mock.assert_not_called()
+
+            # Content not matching the suffix.
+            path.write_text("Hello World!\n")
+            self.assertFalse(archive_utils.can_extract(path))
+
+    def test_nested__merge(self) -> None:
+        with TemporaryDirectory() as source, TemporaryDirectory() as tempdir:
+            source_path = Path(source)
+            directory = Path(tempdir)
+            source_path.joinpath("README").write_text("Outer")
+            source_path.joinpath("sub").mkdir()
+            source_path.joinpath("sub", "file.txt").write_text("File")
+            with zipfile.ZipFile(source_path / "sub" / "nested.zip", mode="w") as zip_file:
+                zip_file.writestr("README", "Nested")
+                zip_file.writestr("sub/nested.txt", "Nested file")
+            archive_path = source_path / "outer.tar.gz"
+            with tarfile.open(archive_path, mode="w:gz") as archive:
+                for name in ["README", "sub/file.txt", "sub/nested.zip"]:
+                    archive.add(source_path / name, arcname=name)
+
+            archive_utils.extract(archive_path=archive_path, target_directory=directory, recurse=True)
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual(["README", "sub/file.txt", "sub/nested.txt", "sub/nested.zip"], actual)
+            # Contents of nested archives take precedence.
+            self.assertEqual("Nested", directory.joinpath("README").read_text())
+            # Nothing has been written next to the archive.
+            self.assertEqual(
+                ["README", "outer.tar.gz", "sub"],
+                sorted(x.name for x in source_path.iterdir()),
+            )
+
+    def test_nested__existing_files(self) -> None:
+        with TemporaryDirectory() as source, TemporaryDirectory() as tempdir:
+            source_path = Path(source)
+            directory = Path(tempdir)
+            source_path.joinpath("README").write_text("Outer")
+            source_path.joinpath("sub").mkdir()
+            source_path.joinpath("sub", "file.txt").write_text("File")
+            archive_path = source_path / "outer.tar.gz"
+            with tarfile.open(archive_path, mode="w:gz") as archive:
+                for name in ["README", "sub/file.txt"]:
+                    archive.add(source_path / name, arcname=name)
+            directory.joinpath("README").write_text("Stale")
+            directory.joinpath("sub").write_text("Stale file instead of directory")
+            directory.joinpath("other.txt").write_text("Other")
+
+            archive_utils.extract(archive_path=archive_path, target_directory=directory, recurse=True)
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual(["README", "other.txt", "sub/file.txt"], actual)
+            # Freshly extracted files replace existing ones.
+            self.assertEqual("Outer", directory.joinpath("README").read_text())
+            self.assertEqual("File", directory.joinpath("sub", "file.txt").read_text())
+            self.assertEqual("Other", directory.joinpath("other.txt").read_text())
+
+    def test_nested__missing_target_directory(self) -> None:
+        with TemporaryDirectory() as source, TemporaryDirectory() as tempdir:
+            source_path = Path(source)
+            directory = Path(tempdir, "new", "target")
+            source_path.joinpath("README").write_text("Outer")
+            archive_path = source_path / "outer.tar.gz"
+            with tarfile.open(archive_path, mode="w:gz") as archive:
+                archive.add(source_path / "README", arcname="README")
+
+            archive_utils.extract(archive_path=archive_path, target_directory=directory, recurse=True)
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual(["README"], actual)
+
     def test_nested(self) -> None:
-        with get_from_url(LIBAIO1__0_3_109_1_25__SRC_RPM) as path:
+        with get_from_url_readonly(LIBAIO1__0_3_109_1_25__SRC_RPM) as path:
             with TemporaryDirectory() as tempdir:
                 directory = Path(tempdir)
                 self.assertTrue(archive_utils.can_extract(path))
@@ -5,10 +5,12 @@
 from __future__ import annotations
 
 import datetime
+import threading
+import time
 from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any
+from typing import Any, Generator
 from unittest import mock, TestCase
 
 import requests
@@ -35,6 +37,24 @@ class DownloadTestCase(TestCase):
         ):
             Download(url="http://localhost", filename="dummy", sha256="INVALID").verify_checksum(b"Hello World!\n")
 
+    def test_verify_digest(self) -> None:
+        # No checksum.
+        Download(url="http://localhost", filename="dummy").verify_digest("03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340")
+
+        # Correct sha256 checksum.
+        Download(
+            url="http://localhost", filename="dummy", sha256="03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340"
+        ).verify_digest("03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340")
+
+        # Incorrect sha256 checksum.
+        with self.assertRaisesRegex(
+                expected_exception=ChecksumError,
+                expected_regex=r"^Checksum mismatch: Got 03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340, expected INVALID!$"
+        ):
+            Download(url="http://localhost", filename="dummy", sha256="INVALID").verify_digest(
+                "03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340"
+            )
+
 
 class GetSessionTestCase(TestCase):
     def test_get_session(self) -> None:
@@ -44,10 +64,29 @@ class GetSessionTestCase(TestCase):
 
 
 class DownloadFileTestCase(TestCase):
+    def test_reuse_session(self) -> None:
+        session = download_utils.get_session()
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = BytesIO(b"Hello World!\n")
+        file_object = BytesIO()
+
+        with mock.patch.object(download_utils, "get_session") as session_mock, \
+                mock.patch.object(session, "get", return_value=response) as get_mock:
+            download_utils.download_file(
+                url="http://localhost",
+                file_object=file_object,
+                session=session,
+            )
+        session_mock.assert_not_called()
+        get_mock.assert_called_once_with("http://localhost", stream=True)
+        self.assertEqual(b"Hello World!\n", file_object.getvalue())
+
     def test_not_okay(self) -> None:
         session = download_utils.get_session()
         response = requests.Response()
         response.status_code = 404
+        response.raw = BytesIO()
         file_object = BytesIO()
         with mock.patch.object(download_utils, "get_session", return_value=session), \
                 mock.patch.object(session, "get", return_value=response):
@@ -65,7 +104,7 @@ class DownloadFileTestCase(TestCase):
         session = download_utils.get_session()
         response = requests.Response()
         response.status_code = 200
-        response._content = b"Hello World!\n"
+        response.raw = BytesIO(b"Hello World!\n")
         file_object = BytesIO()
 
         with mock.patch.object(download_utils, "get_session", return_value=session), \
@@ -105,6 +144,7 @@ class DownloadFileToDirectoryTestCase(TestCase):
         session = download_utils.get_session()
         response = requests.Response()
         response.status_code = 404
+        response.raw = BytesIO()
         with mock.patch.object(session, "get", return_value=response):
             with self.assertRaisesRegex(
                     expected_exception=DownloadError,
@@ -120,24 +160,46 @@ class DownloadFileToDirectoryTestCase(TestCase):
         session = download_utils.get_session()
         response = requests.Response()
         response.status_code = 200
-        response._content = b"Hello World!\n"
+        response.raw = BytesIO(b"Hello World!\n")
 
-        with mock.patch.object(session, "get", return_value=response):
+        with mock.patch.object(session, "get", return_value=response), TemporaryDirectory() as directory:
             with self.assertRaisesRegex(
                     expected_exception=ChecksumError,
                     expected_regex=r"^Checksum mismatch: Got 03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340, expected INVALID!$"
             ):
                 download_utils.download_file_to_directory(
                     download=Download(url="http://localhost", filename="dummy", sha256="INVALID"),
-                    directory=Path("/dummy"),
+                    directory=Path(directory),
+                    session=session,
+                )
+            self.assertFalse(Path(directory, "dummy").exists())
+
+    def test_interrupted(self) -> None:
+        session = download_utils.get_session()
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = BytesIO()
+
+        def iter_content(*args: Any, **kwargs: Any) -> Generator[bytes, None, None]:
+            yield b"partial"
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        with mock.patch.object(session, "get", return_value=response), mock.patch.object(
+            response, "iter_content", side_effect=iter_content
+        ), TemporaryDirectory() as directory:
+            with self.assertRaisesRegex(expected_exception=requests.exceptions.ChunkedEncodingError, expected_regex=r"^Connection broken$"):
+                download_utils.download_file_to_directory(
+                    download=Download(url="http://localhost", filename="dummy", sha256="03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340"),
+                    directory=Path(directory),
                     session=session,
                 )
+            self.assertFalse(Path(directory, "dummy").exists())
 
     def test_valid(self) -> None:
         session = download_utils.get_session()
         response = requests.Response()
         response.status_code = 200
-        response._content = b"Hello World!\n"
+        response.raw = BytesIO(b"Hello World!\n")
 
         with mock.patch.object(session, "get", return_value=response), TemporaryDirectory() as directory:
             download_utils.download_file_to_directory(
@@ -164,7 +226,7 @@ class DownloadOneFilePerSecondTestCase(TestCase):
 
         self.session = download_utils.get_session()
         self._session_patcher = mock.patch.object(download_utils, "get_session", return_value=self.session)
-        self._session_patcher.start()
+        self.get_session_mock = self._session_patcher.start()
         self.addCleanup(self._session_patcher.stop)
 
     def test_error(self) -> None:
@@ -174,7 +236,7 @@ class DownloadOneFilePerSecondTestCase(TestCase):
         def get(url: str, *args: Any, **kwargs: Any) -> requests.Response:
             response = requests.Response()
             response.status_code = 200
-            response._content = b"Hello World!\n"
+            response.raw = BytesIO(b"Hello World!\n")
             return response
 
         with mock.patch.object(self.session, "get", side_effect=get), TemporaryDirectory() as directory:
@@ -190,12 +252,37 @@ class DownloadOneFilePerSecondTestCase(TestCase):
                 Path(directory, "file1.txt").read_bytes()
             )
 
+    def test_error__multiple_hosts(self) -> None:
+        # The first host is still downloading when the second one fails, but fails afterwards as well.
+        downloads = [
+            Download(url="http://localhost/file1", filename="file1.txt", sha256="INVALID"),
+            Download(url="http://127.0.0.1/file2", filename="file2.txt"),
+        ]
+        second_host_failed = threading.Event()
+
+        def get(url: str, *args: Any, **kwargs: Any) -> requests.Response:
+            if url.startswith("http://127.0.0.1/"):
+                second_host_failed.set()
+                raise requests.ConnectionError("Connection refused")
+            second_host_failed.wait(timeout=5)
+            time.sleep(0.2)
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = BytesIO(b"Hello World!\n")
+            return response
+
+        with mock.patch.object(self.session, "get", side_effect=get), TemporaryDirectory() as directory:
+            with self.assertRaisesRegex(expected_exception=requests.ConnectionError, expected_regex=r"^Connection refused$"):
+                download_utils.download_one_file_per_second(downloads=downloads, directory=Path(directory))
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual([], actual)
+
     def test_delays(self) -> None:
         def get(url: str, *args: Any, **kwargs: Any) -> requests.Response:
             self.timestamps.append(datetime.datetime.now())
             response = requests.Response()
             response.status_code = 200
-            response._content = b"Hello World!\n"
+            response.raw = BytesIO(b"Hello World!\n")
             return response
 
         with mock.patch.object(self.session, "get", side_effect=get), TemporaryDirectory() as directory:
@@ -212,3 +299,34 @@ class DownloadOneFilePerSecondTestCase(TestCase):
         deltas: list[datetime.timedelta] = [y - x for x, y in zip(self.timestamps[:-1], self.timestamps[1:])]
         for delta in deltas:
             self.assertGreaterEqual(delta.total_seconds(), 1)
+
+    def test_multiple_hosts(self) -> None:
+        self.downloads.extend([
+            Download(url="http://127.0.0.1/file4", filename="file4.txt", sha256="03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340"),
+            Download(url="http://127.0.0.1/file5", filename="file5.txt", sha256="03ba204e50d126e4674c005e04d82e84c21366780af1f43bd54a37816b6ab340"),
+        ])
+        timestamps: dict[str, list[datetime.datetime]] = {"localhost": [], "127.0.0.1": []}
+
+        def get(url: str, *args: Any, **kwargs: Any) -> requests.Response:
+            timestamps[url.split("/")[2]].append(datetime.datetime.now())
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = BytesIO(b"Hello World!\n")
+            return response
+
+        with mock.patch.object(self.session, "get", side_effect=get), TemporaryDirectory() as directory:
+            download_utils.download_one_file_per_second(downloads=self.downloads, directory=Path(directory))
+            actual = [x[1] for x in get_files_from_directory(directory)]
+            self.assertEqual(["file1.txt", "file2.txt", "file3.txt", "file4.txt", "file5.txt"], actual)
+
+        for host_timestamps in timestamps.values():
+            deltas = [y - x for x, y in zip(host_timestamps[:-1], host_timestamps[1:])]
+            for delta in deltas:
+                self.assertGreaterEqual(delta.total_seconds(), 1)
+
+        # The hosts are being handled in parallel.
+        first_requests = [host_timestamps[0] for host_timestamps in timestamps.values()]
+        self.assertLess(abs((first_requests[1] - first_requests[0]).total_seconds()), 1)
+
+        # Each host uses its own session.
+        self.assertEqual(2, self.get_session_mock.call_count)
@@ -5,9 +5,10 @@
 from __future__ import annotations
 
 import re
+import shutil
 import sys
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import mkdtemp, TemporaryDirectory
 from unittest import TestCase
 
 from license_tools.utils.path_utils import get_file_type, get_files_from_directory, DirectoryWithFixedNameContext, get_mime_type
@@ -16,23 +17,51 @@ from tests.data import LICENSE_PATH, SETUP_PATH
 
 
 class GetFilesFromDirectoryTestCase(TestCase):
+    directory: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The listing does not modify the directory, thus create it only once.
+        cls.directory = Path(mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, cls.directory)
+
+        cls.directory.joinpath("module1.py").touch()
+        cls.directory.joinpath("module2.py").touch()
+        cls.directory.joinpath("submodule").mkdir(parents=True)
+        cls.directory.joinpath("submodule").joinpath("nested.py").touch()
+        cls.directory.joinpath("empty").joinpath("sub").mkdir(parents=True)
+        cls.directory.joinpath("empty").joinpath("sub").joinpath("hello.py").touch()
+
     def test_get_files_from_directory(self) -> None:
+        directory = self.directory
+        result = list(get_files_from_directory(str(directory)))
+        self.assertListEqual(
+            [
+                (directory / "empty" / "sub" / "hello.py", "empty/sub/hello.py"),
+                (directory / "module1.py", "module1.py"),
+                (directory / "module2.py", "module2.py"),
+                (directory / "submodule" / "nested.py", "submodule/nested.py"),
+            ],
+            result,
+        )
+
+    def test_symlinks(self) -> None:
         with TemporaryDirectory() as temporary_directory:
             directory = Path(temporary_directory)
 
-            directory.joinpath("module1.py").touch()
-            directory.joinpath("module2.py").touch()
-            directory.joinpath("submodule").mkdir(parents=True)
+            directory.joinpath("submodule").mkdir()
             directory.joinpath("submodule").joinpath("nested.py").touch()
-            directory.joinpath("empty").joinpath("sub").mkdir(parents=True)
-            directory.joinpath("empty").joinpath("sub").joinpath("hello.py").touch()
+            directory.joinpath("module.py").touch()
+            directory.joinpath("link_to_directory").symlink_to(directory / "submodule")
+            directory.joinpath("link_to_file").symlink_to(directory / "module.py")
+            directory.joinpath("broken_link").symlink_to(directory / "missing.py")
 
             result = list(get_files_from_directory(temporary_directory))
             self.assertListEqual(
                 [
-                    (directory / "empty" / "sub" / "hello.py", "empty/sub/hello.py"),
-                    (directory / "module1.py", "module1.py"),
-                    (directory / "module2.py", "module2.py"),
+                    (directory / "broken_link", "broken_link"),
+                    (directory / "link_to_file", "link_to_file"),
+                    (directory / "module.py", "module.py"),
                     (directory / "submodule" / "nested.py", "submodule/nested.py"),
                 ],
                 result,
@@ -63,3 +63,32 @@ Multiple 2: [42, 43, 44]
 """[1:-1],
             result
         )
+
+    def test_render_dictionary__single_and_empty_values(self) -> None:
+        single = [42]
+        dictionary = {
+            "single": single,
+            "single_set": {"value"},
+            "empty": [],
+        }
+        mapping = {
+            "single": "Single",
+            "single_set": "Single Set",
+            "empty": "Empty",
+        }
+
+        result = rendering_utils.render_dictionary(
+            dictionary=dictionary,
+            verbose_names_mapping=mapping,
+            multi_value_keys={"single", "single_set", "empty"},
+        )
+        self.assertEqual(
+            """
+    Single: 42
+Single Set: value
+     Empty:
+"""[1:-1],
+            result
+        )
+        # The input has not been modified.
+        self.assertEqual([42], single)